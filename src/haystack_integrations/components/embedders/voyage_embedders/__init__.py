@@ -3,6 +3,9 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from haystack_integrations.components.embedders.voyage_embedders.voyage_document_embedder import VoyageDocumentEmbedder
+from haystack_integrations.components.embedders.voyage_embedders.voyage_multimodal_embedder import (
+    VoyageMultimodalEmbedder,
+)
 from haystack_integrations.components.embedders.voyage_embedders.voyage_text_embedder import VoyageTextEmbedder
 
-__all__ = ["VoyageDocumentEmbedder", "VoyageTextEmbedder"]
+__all__ = ["VoyageDocumentEmbedder", "VoyageMultimodalEmbedder", "VoyageTextEmbedder"]
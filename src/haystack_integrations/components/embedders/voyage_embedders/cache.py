@@ -0,0 +1,60 @@
+import sqlite3
+from pathlib import Path
+from typing import Dict, List, Union
+
+import numpy as np
+
+
+class EmbeddingCache:
+    """
+    A small SQLite-backed key-value store for embedding vectors.
+
+    Keys are opaque strings (callers hash the embedding-affecting parameters into them); vectors are stored as
+    packed float32 or int8 blobs, so a 1024-dimension vector costs 4 KB on disk instead of a pickled Python list.
+    The database is opened in WAL mode so concurrent readers do not block the writer.
+    """
+
+    _SELECT_CHUNK_SIZE = 500
+
+    def __init__(self, cache_path: Union[str, Path]):
+        self.cache_path = Path(cache_path)
+        self._connection = sqlite3.connect(str(self.cache_path), check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vec BLOB, dtype TEXT, dim INTEGER)"
+        )
+        self._connection.commit()
+
+    def get_many(self, keys: List[str]) -> Dict[str, List[float]]:
+        """
+        Fetch the cached vectors for the given keys; keys without an entry are simply absent from the result.
+        """
+        found: Dict[str, List[float]] = {}
+        for i in range(0, len(keys), self._SELECT_CHUNK_SIZE):
+            chunk = keys[i : i + self._SELECT_CHUNK_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self._connection.execute(
+                f"SELECT key, vec, dtype FROM embeddings WHERE key IN ({placeholders})",  # noqa: S608
+                chunk,
+            )
+            for key, blob, dtype in rows:
+                found[key] = np.frombuffer(blob, dtype=np.dtype(dtype)).tolist()
+        return found
+
+    def set_many(self, items: Dict[str, List[float]]) -> None:
+        """
+        Insert or overwrite cache entries, packing each vector into a compact binary blob.
+        """
+        rows = []
+        for key, vector in items.items():
+            arr = np.asarray(vector)
+            arr = arr.astype(np.int8) if arr.dtype.kind == "i" else arr.astype(np.float32)
+            rows.append((key, arr.tobytes(), arr.dtype.str, arr.shape[0]))
+        self._connection.executemany(
+            "INSERT OR REPLACE INTO embeddings (key, vec, dtype, dim) VALUES (?, ?, ?, ?)", rows
+        )
+        self._connection.commit()
+
+    def close(self) -> None:
+        self._connection.close()
@@ -0,0 +1,21 @@
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from voyageai import Client
+
+
+@lru_cache(maxsize=8)
+def get_client(api_key: str, timeout: int, max_retries: int) -> "Client":
+    """
+    Return a shared `voyageai.Client` for the given connection parameters.
+
+    Pipelines that build embedders per request would otherwise pay for a fresh HTTP session and TLS context
+    each time; caching by (api_key, timeout, max_retries) lets every instance reuse one connection pool.
+
+    The SDK import happens here rather than at module load so that purely serialization-oriented code paths
+    (`to_dict`/`from_dict` tooling, pipeline introspection) do not pay the voyageai import cost.
+    """
+    from voyageai import Client
+
+    return Client(api_key=api_key, max_retries=max_retries, timeout=timeout)
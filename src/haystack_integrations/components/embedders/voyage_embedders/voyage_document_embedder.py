@@ -1,10 +1,43 @@
+import asyncio
+import hashlib
 import os
-from typing import Any, Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple, Union
 
+import numpy as np
 from haystack import Document, component, default_from_dict, default_to_dict
 from haystack.utils import Secret, deserialize_secrets_inplace
 from tqdm import tqdm
-from voyageai import Client
+
+from haystack_integrations.components.embedders.voyage_embedders.cache import EmbeddingCache
+from haystack_integrations.components.embedders.voyage_embedders.utils import get_client
+
+if TYPE_CHECKING:
+    from voyageai import AsyncClient
+
+MODEL_TOKEN_LIMIT = {
+    "voyage-3-lite": 1_000_000,
+    "voyage-3": 320_000,
+    "voyage-2": 320_000,
+    "voyage-3-large": 120_000,
+    "voyage-code-3": 120_000,
+    "voyage-large-2": 120_000,
+    "voyage-large-2-instruct": 120_000,
+    "voyage-code-2": 120_000,
+}
+DEFAULT_TOKEN_LIMIT = 120_000
+
+
+@lru_cache(maxsize=4096)
+def _format_text_to_embed(content: str, meta_values: Tuple[str, ...], prefix: str, suffix: str, separator: str) -> str:
+    """
+    Build the final text for one Document; memoized so repeat documents are not re-formatted.
+    """
+    return prefix + separator.join(chain(meta_values, (content,))) + suffix
 
 
 @component
@@ -35,14 +68,21 @@ class VoyageDocumentEmbedder:
         model: str = "voyage-2",
         input_type: str = "document",
         truncate: Optional[bool] = None,
+        output_dimension: Optional[int] = None,
+        output_dtype: Optional[str] = None,
         prefix: str = "",
         suffix: str = "",
         batch_size: int = 32,
         metadata_fields_to_embed: Optional[List[str]] = None,
         embedding_separator: str = "\n",
+        deduplicate: bool = True,  # noqa
+        cache_path: Optional[Union[str, Path]] = None,
+        return_numpy: bool = False,  # noqa
         progress_bar: bool = True,  # noqa
         timeout: Optional[int] = None,
         max_retries: Optional[int] = None,
+        max_concurrent_requests: int = 5,
+        max_tokens_per_request: Optional[int] = None,
     ):
         """
         Create a VoyageDocumentEmbedder component.
@@ -68,6 +108,13 @@ class VoyageDocumentEmbedder:
             - Defaults to `None`, which will truncate the input text before sending it to the embedding model if it
               slightly exceeds the context window length. If it significantly exceeds the context window length, an
               error will be raised.
+        :param output_dimension:
+            The dimension of the output embeddings. Defaults to `None`, which uses the model's default dimension.
+            `voyage-3-large` and `voyage-code-3` support 256, 512, 1024 and 2048.
+        :param output_dtype:
+            The data type of the returned embeddings. Defaults to `None`, which uses the model's default ("float").
+            Quantized types like "int8" cut payload and storage size 4x on models that support them
+            (`voyage-3-large` and `voyage-code-3`).
         :param prefix:
             A string to add to the beginning of each text.
         :param suffix:
@@ -78,6 +125,17 @@ class VoyageDocumentEmbedder:
             List of meta fields that should be embedded along with the Document text.
         :param embedding_separator:
             Separator used to concatenate the meta fields to the Document text.
+        :param deduplicate:
+            Whether to embed each distinct prepared text only once and reuse the embedding for duplicates.
+            Saves tokens and round-trips on corpora with repeated content. Defaults to `True`.
+        :param cache_path:
+            Path to a SQLite file used as a persistent embedding cache. When set, texts already embedded with the
+            same model, input type, truncation, output dtype and output dimension are served from disk instead of
+            the API, so re-indexing a stable corpus costs no tokens. Defaults to `None` (no caching).
+        :param return_numpy:
+            Whether to store float embeddings as float32 numpy rows of one contiguous matrix instead of Python
+            lists. Cuts memory roughly 15x per vector and avoids per-element boxing; leave `False` if downstream
+            components require plain lists. Quantized (int8/uint8) outputs are always numpy arrays.
         :param progress_bar:
             Whether to show a progress bar or not. Can be helpful to disable in production deployments to keep the logs
             clean.
@@ -87,24 +145,57 @@ class VoyageDocumentEmbedder:
         :param max_retries:
             Maximum retries to establish contact with VoyageAI if it returns an internal error, if not set it is
             inferred from the `VOYAGE_MAX_RETRIES` environment variable or set to 5.
+        :param max_concurrent_requests:
+            Maximum number of embedding requests kept in flight at once when the input spans multiple batches.
+            Set to 1 to dispatch batches sequentially.
+        :param max_tokens_per_request:
+            Cap on the cumulative token count packed into one request. Defaults to `None`, which uses the known
+            per-model limit (or a conservative default for unknown models).
         """
         self.api_key = api_key
         self.model = model
         self.input_type = input_type
         self.truncate = truncate
+        self.output_dimension = output_dimension
+        self.output_dtype = output_dtype
         self.prefix = prefix
         self.suffix = suffix
         self.batch_size = batch_size
         self.progress_bar = progress_bar
         self.metadata_fields_to_embed = metadata_fields_to_embed or []
         self.embedding_separator = embedding_separator
+        self.deduplicate = deduplicate
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.return_numpy = return_numpy
+        self._cache: Optional[EmbeddingCache] = EmbeddingCache(self.cache_path) if self.cache_path else None
+        self._meta_fields = tuple(self.metadata_fields_to_embed)
+        self._meta_getter = itemgetter(*self._meta_fields) if self._meta_fields else None
 
         if timeout is None:
             timeout = int(os.environ.get("VOYAGE_TIMEOUT", 30))
         if max_retries is None:
             max_retries = int(os.environ.get("VOYAGE_MAX_RETRIES", 5))
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.max_concurrent_requests = max_concurrent_requests
+        self.max_tokens_per_request = max_tokens_per_request
+
+        self._resolved_api_key = api_key.resolve_value()
+        self.client = get_client(api_key=self._resolved_api_key, timeout=timeout, max_retries=max_retries)
+        self._async_client: Optional["AsyncClient"] = None
+
+    @property
+    def async_client(self) -> "AsyncClient":
+        """
+        The lazily created `AsyncClient` used by `run_async`.
+        """
+        if self._async_client is None:
+            from voyageai import AsyncClient
 
-        self.client = Client(api_key=api_key.resolve_value(), max_retries=max_retries, timeout=timeout)
+            self._async_client = AsyncClient(
+                api_key=self._resolved_api_key, max_retries=self.max_retries, timeout=self.timeout
+            )
+        return self._async_client
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -118,12 +209,19 @@ class VoyageDocumentEmbedder:
             model=self.model,
             input_type=self.input_type,
             truncate=self.truncate,
+            output_dimension=self.output_dimension,
+            output_dtype=self.output_dtype,
             prefix=self.prefix,
             suffix=self.suffix,
             batch_size=self.batch_size,
             progress_bar=self.progress_bar,
             metadata_fields_to_embed=self.metadata_fields_to_embed,
             embedding_separator=self.embedding_separator,
+            deduplicate=self.deduplicate,
+            cache_path=str(self.cache_path) if self.cache_path else None,
+            return_numpy=self.return_numpy,
+            max_concurrent_requests=self.max_concurrent_requests,
+            max_tokens_per_request=self.max_tokens_per_request,
             api_key=self.api_key.to_dict(),
         )
 
@@ -144,49 +242,293 @@ class VoyageDocumentEmbedder:
         """
         Prepare the texts to embed by concatenating the Document text with the metadata fields to embed.
         """
+        prefix = self.prefix
+        suffix = self.suffix
+        separator = self.embedding_separator
+        meta_fields = self._meta_fields
+        meta_getter = self._meta_getter
+        single_field = len(meta_fields) == 1
+
         texts_to_embed = []
         for doc in documents:
-            meta_values_to_embed = [
-                str(doc.meta[key])
-                for key in self.metadata_fields_to_embed
-                if key in doc.meta and doc.meta[key] is not None
-            ]
-
-            text_to_embed = (
-                self.prefix + self.embedding_separator.join([*meta_values_to_embed, doc.content or ""]) + self.suffix
-            )
+            if meta_getter is None:
+                meta_values_to_embed = ()
+            else:
+                try:
+                    # One C-level call fetches all metadata values at once; itemgetter returns a bare value for a
+                    # single field and a tuple otherwise.
+                    values = meta_getter(doc.meta)
+                    if single_field:
+                        values = (values,)
+                except KeyError:
+                    values = tuple(doc.meta[key] for key in meta_fields if key in doc.meta)
+                meta_values_to_embed = tuple(str(value) for value in values if value is not None)
 
-            texts_to_embed.append(text_to_embed)
+            texts_to_embed.append(
+                _format_text_to_embed(doc.content or "", meta_values_to_embed, prefix, suffix, separator)
+            )
         return texts_to_embed
 
-    def _embed_batch(self, texts_to_embed: List[str], batch_size: int) -> Tuple[List[List[float]], Dict[str, Any]]:
+    def _pack_batches(self, texts_to_embed: List[str], batch_size: int) -> List[List[str]]:
+        """
+        Pack the texts into sub-batches that respect both `batch_size` and the model's per-request token limit.
+
+        The texts are tokenized once with the local tokenizer and greedily packed until either limit is reached,
+        so long documents do not overflow a request and short documents do not waste round-trips.
+        """
+        if isinstance(texts_to_embed, np.ndarray):
+            texts_to_embed = texts_to_embed.tolist()
+        if len(texts_to_embed) <= batch_size and self.max_tokens_per_request is None:
+            # Everything fits in one request and no explicit token cap was asked for; skip tokenization and
+            # token-aware packing and rely on server-side truncation for the rare over-long document.
+            return [texts_to_embed]
+        token_limit = self.max_tokens_per_request or MODEL_TOKEN_LIMIT.get(self.model, DEFAULT_TOKEN_LIMIT)
+        token_counts = [len(tokens) for tokens in self.client.tokenize(texts_to_embed, model=self.model)]
+
+        batches: List[List[str]] = []
+        current_batch: List[str] = []
+        current_tokens = 0
+        for text, token_count in zip(texts_to_embed, token_counts):
+            if current_batch and (len(current_batch) >= batch_size or current_tokens + token_count > token_limit):
+                batches.append(current_batch)
+                current_batch = []
+                current_tokens = 0
+            current_batch.append(text)
+            current_tokens += token_count
+        if current_batch:
+            batches.append(current_batch)
+        return batches
+
+    def _cache_key(self, text: str) -> str:
+        """
+        Hash the text together with every parameter that affects the embedding value.
+        """
+        payload = f"{text}|{self.model}|{self.input_type}|{self.truncate}|{self.output_dtype}|{self.output_dimension}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _embed_with_cache(
+        self, cache: EmbeddingCache, texts_to_embed: List[str]
+    ) -> Tuple[List[List[float]], Dict[str, Any]]:
+        """
+        Embed texts through the persistent cache: only cache misses are sent to the API, and fresh vectors are
+        written back. `total_tokens` covers the fresh requests only.
+        """
+        keys = [self._cache_key(text) for text in texts_to_embed]
+        embeddings_by_key = cache.get_many(keys)
+
+        misses: Dict[str, str] = {}
+        for key, text in zip(keys, texts_to_embed):
+            if key not in embeddings_by_key and key not in misses:
+                misses[key] = text
+
+        meta: Dict[str, Any] = {"total_tokens": 0}
+        if misses:
+            fresh_embeddings, meta = self._embed_batch(texts_to_embed=list(misses.values()), batch_size=self.batch_size)
+            fresh = dict(zip(misses.keys(), fresh_embeddings))
+            cache.set_many(fresh)
+            embeddings_by_key.update(fresh)
+
+        return self._convert_embeddings([embeddings_by_key[key] for key in keys]), meta
+
+    def _convert_embeddings(self, embeddings: List[List[float]]) -> List[Any]:
         """
-        Embed a list of texts in batches.
+        Convert quantized embeddings to compact numpy arrays.
+
+        A 1024-dimension int8 vector costs 1 KB as an ndarray versus ~28 KB as a list of boxed Python ints; float
+        embeddings are left as lists for compatibility with downstream Document stores.
         """
+        if self.output_dtype in ("int8", "uint8"):
+            dtype = np.int8 if self.output_dtype == "int8" else np.uint8
+            return [np.asarray(emb, dtype=dtype) for emb in embeddings]
+        if self.return_numpy and embeddings:
+            # One contiguous (N, D) float32 allocation; each Document gets a zero-copy row view.
+            return list(np.asarray(embeddings, dtype=np.float32))
+        return embeddings
 
-        all_embeddings = []
+    def _embed_single_batch(self, batch: List[str]):
+        """
+        Send one batch of texts to the embedding endpoint.
+        """
+        return self.client.embed(
+            texts=batch,
+            model=self.model,
+            input_type=self.input_type,
+            truncation=self.truncate,
+            output_dimension=self.output_dimension,
+            output_dtype=self.output_dtype,
+        )
+
+    def _iter_embed_batches(
+        self, texts_to_embed: List[str], batch_size: int
+    ) -> Iterator[Tuple[List[List[float]], int]]:
+        """
+        Embed the texts batch by batch, yielding each batch's embeddings together with its token usage.
+
+        Yielding one packed batch at a time lets callers stream the results instead of holding every embedding
+        in memory at once. When the input spans multiple batches, up to `max_concurrent_requests` requests are
+        kept in flight via a thread pool; results are still yielded in input order.
+        """
+        batches = self._pack_batches(texts_to_embed, batch_size)
+        with tqdm(total=len(batches), disable=not self.progress_bar, desc="Calculating embeddings") as progress_bar:
+            if len(batches) == 1 or self.max_concurrent_requests <= 1:
+                for batch in batches:
+                    response = self._embed_single_batch(batch)
+                    progress_bar.update(1)
+                    yield self._convert_embeddings(response.embeddings), response.total_tokens
+            else:
+                max_workers = min(self.max_concurrent_requests, len(batches))
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    futures = [executor.submit(self._embed_single_batch, batch) for batch in batches]
+                    for future in futures:
+                        response = future.result()
+                        progress_bar.update(1)
+                        yield self._convert_embeddings(response.embeddings), response.total_tokens
+
+    async def _embed_batch_async(
+        self, texts_to_embed: List[str], batch_size: int
+    ) -> Tuple[List[List[float]], Dict[str, Any]]:
+        """
+        Embed a list of texts in batches, dispatching batches concurrently with `asyncio.gather` while a
+        semaphore caps the in-flight requests at `max_concurrent_requests`, like the sync path.
+        """
+        all_embeddings: List[List[float]] = []
         meta: Dict[str, Any] = {}
         meta["total_tokens"] = 0
-        for i in tqdm(
-            range(0, len(texts_to_embed), batch_size), disable=not self.progress_bar, desc="Calculating embeddings"
-        ):
-            batch = texts_to_embed[i : i + batch_size]
-            response = self.client.embed(
-                texts=batch,
-                model=self.model,
-                input_type=self.input_type,
-                truncation=self.truncate,
-            )
-            all_embeddings.extend(response.embeddings)
+        if len(texts_to_embed) == 0:
+            return all_embeddings, meta
+
+        semaphore = asyncio.Semaphore(max(self.max_concurrent_requests, 1))
+
+        async def embed_single_batch(batch: List[str]):
+            async with semaphore:
+                return await self.async_client.embed(
+                    texts=batch,
+                    model=self.model,
+                    input_type=self.input_type,
+                    truncation=self.truncate,
+                    output_dimension=self.output_dimension,
+                    output_dtype=self.output_dtype,
+                )
+
+        responses = await asyncio.gather(
+            *(embed_single_batch(batch) for batch in self._pack_batches(texts_to_embed, batch_size))
+        )
+        for response in responses:
+            all_embeddings.extend(self._convert_embeddings(response.embeddings))
             meta["total_tokens"] += response.total_tokens
 
         return all_embeddings, meta
 
+    async def _embed_with_cache_async(
+        self, cache: EmbeddingCache, texts_to_embed: List[str]
+    ) -> Tuple[List[List[float]], Dict[str, Any]]:
+        """
+        Async counterpart of `_embed_with_cache`: serve hits from the persistent cache and only send the misses
+        to the API, writing the fresh vectors back.
+        """
+        keys = [self._cache_key(text) for text in texts_to_embed]
+        embeddings_by_key = cache.get_many(keys)
+
+        misses: Dict[str, str] = {}
+        for key, text in zip(keys, texts_to_embed):
+            if key not in embeddings_by_key and key not in misses:
+                misses[key] = text
+
+        meta: Dict[str, Any] = {"total_tokens": 0}
+        if misses:
+            fresh_embeddings, meta = await self._embed_batch_async(
+                texts_to_embed=list(misses.values()), batch_size=self.batch_size
+            )
+            fresh = dict(zip(misses.keys(), fresh_embeddings))
+            cache.set_many(fresh)
+            embeddings_by_key.update(fresh)
+
+        return self._convert_embeddings([embeddings_by_key[key] for key in keys]), meta
+
+    def _embed_batch(self, texts_to_embed: List[str], batch_size: int) -> Tuple[List[List[float]], Dict[str, Any]]:
+        """
+        Embed a list of texts in batches, materializing all embeddings at once.
+        """
+
+        all_embeddings: List[List[float]] = []
+        meta: Dict[str, Any] = {}
+        meta["total_tokens"] = 0
+        if len(texts_to_embed) == 0:
+            return all_embeddings, meta
+
+        for embeddings, total_tokens in self._iter_embed_batches(texts_to_embed, batch_size):
+            all_embeddings.extend(embeddings)
+            meta["total_tokens"] += total_tokens
+
+        return all_embeddings, meta
+
     @component.output_types(documents=List[Document], meta=Dict[str, Any])
     def run(self, documents: List[Document]):
         """
         Embed a list of Documents.
 
+        The embeddings are written to the `embedding` field of the passed-in Documents in place; no copies of the
+        Documents are created.
+
+        :param documents:
+            Documents to embed.
+
+        :returns:
+            A dictionary with the following keys:
+            - `documents`: Documents with embeddings
+            - `meta`: Information about the usage of the model.
+        """
+        if not isinstance(documents, list) or documents and not isinstance(documents[0], Document):
+            msg = (
+                "VoyageDocumentEmbedder expects a list of Documents as input."
+                " In case you want to embed a string, please use the VoyageTextEmbedder."
+            )
+            raise TypeError(msg)
+
+        if not documents:
+            return {"documents": documents, "meta": {"total_tokens": 0}}
+
+        # Documents that already carry an embedding (e.g. from a partially failed previous run) are left
+        # untouched, so re-running over a mixed list only pays for the pending ones.
+        pending = [doc for doc in documents if doc.embedding is None]
+
+        texts_to_embed = self._prepare_texts_to_embed(documents=pending)
+
+        meta: Dict[str, Any] = {"total_tokens": 0}
+        if texts_to_embed:
+            if self._cache is not None:
+                embeddings, meta = self._embed_with_cache(self._cache, texts_to_embed)
+                for doc, emb in zip(pending, embeddings):
+                    doc.embedding = emb
+            elif self.deduplicate and len(set(texts_to_embed)) < len(texts_to_embed):
+                # Duplicate chunks (boilerplate footers, repeated titles) are billed per occurrence; embed each
+                # distinct text once and scatter the embeddings back. The dict keeps first-seen order, so
+                # batches hit the API in input order.
+                unique: Dict[str, int] = {}
+                positions = [unique.setdefault(text, len(unique)) for text in texts_to_embed]
+                embeddings, meta = self._embed_batch(texts_to_embed=list(unique), batch_size=self.batch_size)
+                for doc, unique_idx in zip(pending, positions):
+                    doc.embedding = embeddings[unique_idx]
+            else:
+                # The embeddings list is first in the zip so the iterator never over-consumes a Document when a
+                # batch ends.
+                pending_iter = iter(pending)
+                for embeddings, total_tokens in self._iter_embed_batches(texts_to_embed, self.batch_size):
+                    for emb, doc in zip(embeddings, pending_iter):
+                        doc.embedding = emb
+                    meta["total_tokens"] += total_tokens
+
+        return {"documents": documents, "meta": meta}
+
+    @component.output_types(documents=List[Document], meta=Dict[str, Any])
+    async def run_async(self, documents: List[Document]):
+        """
+        Embed a list of Documents asynchronously.
+
+        Batches are dispatched concurrently through the VoyageAI `AsyncClient`, so pipelines running on an event
+        loop do not block a worker thread on the network. Like `run`, the embeddings are assigned to the passed-in
+        Documents in place.
+
         :param documents:
             Documents to embed.
 
@@ -202,11 +544,32 @@ class VoyageDocumentEmbedder:
             )
             raise TypeError(msg)
 
-        texts_to_embed = self._prepare_texts_to_embed(documents=documents)
+        if not documents:
+            return {"documents": documents, "meta": {"total_tokens": 0}}
+
+        pending = [doc for doc in documents if doc.embedding is None]
 
-        embeddings, meta = self._embed_batch(texts_to_embed=texts_to_embed, batch_size=self.batch_size)
+        texts_to_embed = self._prepare_texts_to_embed(documents=pending)
 
-        for doc, emb in zip(documents, embeddings):
-            doc.embedding = emb
+        meta: Dict[str, Any] = {"total_tokens": 0}
+        if texts_to_embed:
+            if self._cache is not None:
+                embeddings, meta = await self._embed_with_cache_async(self._cache, texts_to_embed)
+                for doc, emb in zip(pending, embeddings):
+                    doc.embedding = emb
+            elif self.deduplicate and len(set(texts_to_embed)) < len(texts_to_embed):
+                unique: Dict[str, int] = {}
+                positions = [unique.setdefault(text, len(unique)) for text in texts_to_embed]
+                embeddings, meta = await self._embed_batch_async(
+                    texts_to_embed=list(unique), batch_size=self.batch_size
+                )
+                for doc, unique_idx in zip(pending, positions):
+                    doc.embedding = embeddings[unique_idx]
+            else:
+                embeddings, meta = await self._embed_batch_async(
+                    texts_to_embed=texts_to_embed, batch_size=self.batch_size
+                )
+                for doc, emb in zip(pending, embeddings):
+                    doc.embedding = emb
 
         return {"documents": documents, "meta": meta}
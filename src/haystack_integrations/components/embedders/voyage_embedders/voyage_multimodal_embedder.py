@@ -0,0 +1,548 @@
+import asyncio
+import hashlib
+import io
+import os
+import pickle
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+from haystack import component, default_from_dict, default_to_dict
+from haystack.dataclasses import ByteStream
+from haystack.utils import Secret, deserialize_secrets_inplace
+from PIL import Image
+from tqdm import tqdm
+
+from haystack_integrations.components.embedders.voyage_embedders.cache import EmbeddingCache
+from haystack_integrations.components.embedders.voyage_embedders.utils import get_client
+
+if TYPE_CHECKING:
+    from voyageai import AsyncClient
+
+
+def _identity(item: Any) -> Any:
+    return item
+
+
+# Budget for decoded image pixels kept per embedder instance; at roughly 25 MB per decoded 4K image this holds
+# a couple of recent images without pinning multi-GB pixel buffers process-wide.
+_IMAGE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
+@component
+class VoyageMultimodalEmbedder:
+    """
+    A component for embedding multimodal inputs using Voyage multimodal embedding models.
+
+    Each input row is a list of content items - strings, PIL images, Haystack `ByteStream`s carrying encoded
+    image data, or voyageai `Video` objects - that are interleaved into a single multimodal document.
+
+    Usage example:
+    ```python
+    from haystack_integrations.components.embedders.voyage_embedders import VoyageMultimodalEmbedder
+
+    embedder = VoyageMultimodalEmbedder()
+
+    result = embedder.run(inputs=[["This is a banana.", banana_image]])
+    print(result['embeddings'][0])
+
+    # [0.017020374536514282, -0.023255806416273117, ...]
+    ```
+    """
+
+    def __init__(
+        self,
+        api_key: Secret = Secret.from_env_var("VOYAGE_API_KEY"),
+        model: str = "voyage-multimodal-3",
+        input_type: Optional[str] = None,
+        truncate: Optional[bool] = None,
+        batch_size: int = 8,
+        max_pixels_per_batch: int = 20_000_000,
+        max_chars_per_batch: int = 120_000,
+        cache_path: Optional[Union[str, Path]] = None,
+        return_numpy: bool = False,  # noqa
+        progress_bar: bool = True,  # noqa
+        timeout: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        max_concurrent_requests: int = 4,
+    ):
+        """
+        Create a VoyageMultimodalEmbedder component.
+
+        :param api_key:
+            The VoyageAI API key. It can be explicitly provided or automatically read from the environment variable
+            VOYAGE_API_KEY (recommended).
+        :param model:
+            The name of the model to use. Defaults to "voyage-multimodal-3".
+            For more details on the available models,
+            see [Voyage Multimodal Embeddings documentation](https://docs.voyageai.com/docs/multimodal-embeddings).
+        :param input_type:
+            Type of the input. This is used to prepend different prompts to the content.
+            - Can be set to `"document"` or `"query"`.
+            - Defaults to `None` for no prompt.
+        :param truncate:
+            Whether to truncate the inputs to fit within the context length. Defaults to `None`, which uses the
+            API default of truncating over-length inputs.
+        :param batch_size:
+            Maximum number of input rows to encode at once.
+        :param max_pixels_per_batch:
+            Pixel-component budget per request (summed `width * height * 3` over the images in a batch). A batch
+            of a few 4K images is flushed early instead of being padded out to `batch_size` rows, keeping request
+            payloads near the server's sweet spot.
+        :param max_chars_per_batch:
+            Character budget per request, summed over the text items in a batch.
+        :param cache_path:
+            Path to a SQLite file used as a persistent embedding cache. When set, rows whose content was embedded
+            with the same model settings in a previous run are served from disk and never sent to the API.
+            Defaults to `None`, which disables caching.
+        :param return_numpy:
+            When `True`, return the embeddings as a single `float32` numpy array of shape `(num_inputs, dim)`
+            instead of nested Python lists. This avoids boxing every component into a Python float and lets
+            downstream vector math operate on the matrix directly.
+        :param progress_bar:
+            Whether to show a progress bar or not. Can be helpful to disable in production deployments to keep the logs
+            clean.
+        :param timeout:
+            Timeout for VoyageAI Client calls, if not set it is inferred from the `VOYAGE_TIMEOUT` environment variable
+            or set to 30.
+        :param max_retries:
+            Maximum retries to establish contact with VoyageAI if it returns an internal error, if not set it is
+            inferred from the `VOYAGE_MAX_RETRIES` environment variable or set to 5.
+        :param max_concurrent_requests:
+            Maximum number of embedding requests kept in flight at once when the input spans multiple batches.
+            Set to 1 to dispatch batches sequentially.
+        """
+        self.api_key = api_key
+        self.model = model
+        self.input_type = input_type
+        self.truncate = truncate
+        self.batch_size = batch_size
+        self.max_pixels_per_batch = max_pixels_per_batch
+        self.max_chars_per_batch = max_chars_per_batch
+        self.cache_path = Path(cache_path) if cache_path is not None else None
+        self.return_numpy = return_numpy
+        self.progress_bar = progress_bar
+        self.max_concurrent_requests = max_concurrent_requests
+        self._cache: Optional[EmbeddingCache] = EmbeddingCache(self.cache_path) if self.cache_path is not None else None
+        # Decoded-image LRU keyed on the raw encoded bytes and bounded by total pixel bytes; per instance, so
+        # the pixel buffers are released with the embedder instead of being pinned process-wide.
+        self._image_cache: "OrderedDict[bytes, Image.Image]" = OrderedDict()
+        self._image_cache_bytes = 0
+        # Exact-type dispatch table for content conversion: a dict lookup on type(item) is cheaper than walking
+        # an isinstance chain per element. Subclasses (e.g. PIL's format-specific image classes) fall back to
+        # `_convert_slow`, which registers them here so only their first occurrence pays for the isinstance
+        # walk. voyageai's Video type is deliberately absent and registered lazily on first sight, so
+        # constructing an embedder does not pull in the video-decoding stack.
+        self._converters: Dict[type, Callable[[Any], Any]] = {
+            str: _identity,
+            Image.Image: _identity,
+            ByteStream: self._bytestream_to_pil,
+        }
+
+        if timeout is None:
+            timeout = int(os.environ.get("VOYAGE_TIMEOUT", 30))
+        if max_retries is None:
+            max_retries = int(os.environ.get("VOYAGE_MAX_RETRIES", 5))
+        self.timeout = timeout
+        self.max_retries = max_retries
+
+        self._resolved_api_key = api_key.resolve_value()
+        self.client = get_client(api_key=self._resolved_api_key, timeout=timeout, max_retries=max_retries)
+        self._async_client: Optional["AsyncClient"] = None
+
+    @property
+    def async_client(self) -> "AsyncClient":
+        """
+        The lazily created `AsyncClient` used by `run_async`.
+        """
+        if self._async_client is None:
+            from voyageai import AsyncClient
+
+            self._async_client = AsyncClient(
+                api_key=self._resolved_api_key, max_retries=self.max_retries, timeout=self.timeout
+            )
+        return self._async_client
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Serializes the component to a dictionary.
+
+        :returns:
+            Dictionary with serialized data.
+        """
+        return default_to_dict(
+            self,
+            model=self.model,
+            input_type=self.input_type,
+            truncate=self.truncate,
+            batch_size=self.batch_size,
+            max_pixels_per_batch=self.max_pixels_per_batch,
+            max_chars_per_batch=self.max_chars_per_batch,
+            cache_path=str(self.cache_path) if self.cache_path is not None else None,
+            return_numpy=self.return_numpy,
+            progress_bar=self.progress_bar,
+            max_concurrent_requests=self.max_concurrent_requests,
+            api_key=self.api_key.to_dict(),
+        )
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "VoyageMultimodalEmbedder":
+        """
+        Deserializes the component from a dictionary.
+
+        :param data:
+            Dictionary to deserialize from.
+        :returns:
+            Deserialized component.
+        """
+        deserialize_secrets_inplace(data["init_parameters"], keys=["api_key"])
+        return default_from_dict(cls, data)
+
+    def _decode_bytestream(self, data: bytes) -> Image.Image:
+        """
+        Decode encoded image bytes into a PIL image, eagerly loading the pixel data so the `BytesIO` handle can
+        be dropped immediately.
+
+        The same encoded image often reappears across runs (index refreshes, retries) and PNG/JPEG decompression
+        dominates preprocessing, so decoded results are memoized on the raw bytes, bounded by a pixel-byte budget
+        with least-recently-used eviction.
+        """
+        cached = self._image_cache.get(data)
+        if cached is not None:
+            self._image_cache.move_to_end(data)
+            return cached
+
+        image = Image.open(io.BytesIO(data))
+        image.load()
+        width, height = image.size
+        self._image_cache[data] = image
+        self._image_cache_bytes += width * height * len(image.getbands())
+        while self._image_cache_bytes > _IMAGE_CACHE_MAX_BYTES and len(self._image_cache) > 1:
+            _, evicted = self._image_cache.popitem(last=False)
+            evicted_width, evicted_height = evicted.size
+            self._image_cache_bytes -= evicted_width * evicted_height * len(evicted.getbands())
+        return image
+
+    def _bytestream_to_pil(self, item: ByteStream) -> Image.Image:
+        return self._decode_bytestream(item.data)
+
+    def _convert_slow(self, item: Any) -> Any:
+        """
+        Fallback for content item types without an exact entry in the dispatch table.
+
+        Subclasses of the supported types are registered in the table on first sight, so later occurrences take
+        the fast dict-lookup path.
+        """
+        fallbacks: List[Tuple[type, Callable[[Any], Any]]] = [
+            (str, _identity),
+            (Image.Image, _identity),
+            (ByteStream, self._bytestream_to_pil),
+        ]
+        for base, converter in fallbacks:
+            if isinstance(item, base):
+                self._converters[type(item)] = converter
+                return converter(item)
+
+        from voyageai.video_utils import Video
+
+        if isinstance(item, Video):
+            self._converters[type(item)] = _identity
+            return item
+        msg = (
+            f"VoyageMultimodalEmbedder received a content item of unsupported type {type(item).__name__}. "
+            "Supported types are str, PIL.Image.Image, haystack ByteStream, and voyageai Video."
+        )
+        raise TypeError(msg)
+
+    def _convert_content_item(self, item: Any) -> Any:
+        """
+        Convert one content item to a type the VoyageAI SDK accepts.
+
+        Strings, PIL images and videos pass through unchanged; `ByteStream`s with encoded image data are decoded
+        into PIL images.
+        """
+        converter = self._converters.get(type(item))
+        if converter is not None:
+            return converter(item)
+        return self._convert_slow(item)
+
+    def _prepare_inputs(self, inputs: List[List[Any]]) -> List[List[Any]]:
+        """
+        Convert every content item of every input row to an SDK-compatible type.
+        """
+        converters = self._converters
+        fallback = self._convert_slow
+        return [[converters.get(type(item), fallback)(item) for item in row] for row in inputs]
+
+    def _embed_single_batch(self, batch: List[List[Any]]):
+        """
+        Send one batch of multimodal inputs to the embedding endpoint.
+        """
+        return self.client.multimodal_embed(
+            inputs=batch,
+            model=self.model,
+            input_type=self.input_type,
+            truncation=self.truncate,
+        )
+
+    @component.output_types(embeddings=List[List[float]], meta=Dict[str, Any])
+    def run(self, inputs: List[List[Any]]):
+        """
+        Embed a list of multimodal inputs.
+
+        When the input spans multiple batches, up to `max_concurrent_requests` requests are kept in flight at
+        once; the returned embeddings are always in input order.
+
+        :param inputs:
+            A list of input rows, each a list of content items (strings, PIL images, `ByteStream`s, or videos)
+            to interleave into one multimodal document.
+
+        :returns:
+            A dictionary with the following keys:
+            - `embeddings`: The embeddings, one per input row. A `(num_inputs, dim)` float32 numpy array when
+              `return_numpy` is set, nested Python lists otherwise.
+            - `meta`: Information about the usage of the model.
+        """
+        # Exact-type checks on the container and its first row only; the per-item types are validated as part of
+        # content conversion, so re-walking the whole structure here would just duplicate that pass.
+        if type(inputs) is not list or (inputs and type(inputs[0]) is not list):
+            msg = (
+                "VoyageMultimodalEmbedder expects a list of lists of content items as input."
+                " In case you want to embed plain strings, please use the VoyageTextEmbedder."
+            )
+            raise TypeError(msg)
+
+        meta: Dict[str, Any] = {"text_tokens": 0, "image_pixels": 0, "video_pixels": 0, "total_tokens": 0}
+        if not inputs:
+            return {"embeddings": [], "meta": meta}
+
+        # Text-only inputs (the common case) need no conversion at all; one short-circuiting scan is cheaper
+        # than rebuilding the nested structure through the dispatch table.
+        if all(type(item) is str for row in inputs for item in row):
+            prepared = inputs
+        else:
+            prepared = self._prepare_inputs(inputs)
+
+        if self._cache is not None:
+            return self._run_with_cache(self._cache, prepared, meta)
+
+        return self._embed_prepared(prepared, meta)
+
+    def _cache_key(self, row: List[Any]) -> str:
+        """
+        Hash one converted input row together with the embedding-affecting settings into a cache key.
+        """
+        hasher = hashlib.sha256()
+        for item in row:
+            if isinstance(item, str):
+                hasher.update(b"s")
+                hasher.update(item.encode("utf-8"))
+            elif isinstance(item, Image.Image):
+                hasher.update(b"i")
+                hasher.update(f"{item.mode}|{item.size}".encode())
+                hasher.update(item.tobytes())
+            else:
+                hasher.update(b"o")
+                hasher.update(pickle.dumps(item))
+        hasher.update(f"|{self.model}|{self.input_type}|{self.truncate}".encode())
+        return hasher.hexdigest()
+
+    def _run_with_cache(self, cache: EmbeddingCache, prepared: List[List[Any]], meta: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Serve rows from the persistent cache where possible, embedding and persisting only the misses.
+        """
+        keys = [self._cache_key(row) for row in prepared]
+        found = cache.get_many(keys)
+        misses = {key: row for key, row in zip(keys, prepared) if key not in found}
+        if misses:
+            miss_result = self._embed_prepared(list(misses.values()), meta)
+            new_entries = dict(zip(misses, miss_result["embeddings"]))
+            cache.set_many(new_entries)
+            found.update(new_entries)
+
+        embeddings: Any = [found[key] for key in keys]
+        if self.return_numpy:
+            embeddings = np.asarray(embeddings, dtype=np.float32)
+        return {"embeddings": embeddings, "meta": meta}
+
+    def _pack_batches(self, prepared: List[List[Any]]) -> List[List[List[Any]]]:
+        """
+        Greedily pack converted rows into batches bounded by row count, total image pixels, and total text
+        characters, so a batch of large images is flushed early instead of being padded to `batch_size` rows.
+        """
+        batches: List[List[List[Any]]] = []
+        current: List[List[Any]] = []
+        pixels = 0
+        chars = 0
+        for row in prepared:
+            row_pixels = 0
+            row_chars = 0
+            for item in row:
+                if type(item) is str:
+                    row_chars += len(item)
+                elif isinstance(item, Image.Image):
+                    width, height = item.size
+                    row_pixels += width * height * 3
+            if current and (
+                len(current) >= self.batch_size
+                or pixels + row_pixels > self.max_pixels_per_batch
+                or chars + row_chars > self.max_chars_per_batch
+            ):
+                batches.append(current)
+                current, pixels, chars = [], 0, 0
+            current.append(row)
+            pixels += row_pixels
+            chars += row_chars
+        if current:
+            batches.append(current)
+        return batches
+
+    def _embed_prepared(self, prepared: List[List[Any]], meta: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Batch converted rows and dispatch them to the embedding endpoint, keeping up to
+        `max_concurrent_requests` requests in flight.
+        """
+        batches = self._pack_batches(prepared)
+
+        with tqdm(total=len(batches), disable=not self.progress_bar, desc="Calculating embeddings") as progress_bar:
+            if len(batches) == 1 or self.max_concurrent_requests <= 1:
+                responses = []
+                for batch in batches:
+                    responses.append(self._embed_single_batch(batch))
+                    progress_bar.update(1)
+            else:
+                max_workers = min(self.max_concurrent_requests, len(batches))
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    futures = [executor.submit(self._embed_single_batch, batch) for batch in batches]
+                    responses = []
+                    for future in futures:
+                        responses.append(future.result())
+                        progress_bar.update(1)
+
+        return self._merge_responses(responses, num_inputs=len(prepared), meta=meta)
+
+    def _merge_responses(self, responses: List[Any], num_inputs: int, meta: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Merge per-batch responses into the output dictionary, preserving batch order.
+        """
+        # Usage counters are reduced in one vectorized sum over a (num_batches, 4) array instead of four
+        # Python-level += per batch.
+        meta_arr = np.empty((len(responses), 4), dtype=np.int64)
+        if self.return_numpy:
+            dim = len(responses[0].embeddings[0])
+            embeddings: Any = np.empty((num_inputs, dim), dtype=np.float32)
+            start = 0
+            for idx, response in enumerate(responses):
+                batch_embeddings = response.embeddings
+                embeddings[start : start + len(batch_embeddings)] = np.asarray(batch_embeddings, dtype=np.float32)
+                start += len(batch_embeddings)
+                meta_arr[idx] = (
+                    response.text_tokens,
+                    response.image_pixels,
+                    response.video_pixels,
+                    response.total_tokens,
+                )
+        else:
+            # Preallocate the full output and fill disjoint slices per batch instead of growing with extend(),
+            # avoiding capacity-doubling reallocations.
+            embeddings = [None] * num_inputs
+            start = 0
+            for idx, response in enumerate(responses):
+                batch_embeddings = response.embeddings
+                embeddings[start : start + len(batch_embeddings)] = batch_embeddings
+                start += len(batch_embeddings)
+                meta_arr[idx] = (
+                    response.text_tokens,
+                    response.image_pixels,
+                    response.video_pixels,
+                    response.total_tokens,
+                )
+        meta["text_tokens"], meta["image_pixels"], meta["video_pixels"], meta["total_tokens"] = meta_arr.sum(
+            axis=0
+        ).tolist()
+
+        return {"embeddings": embeddings, "meta": meta}
+
+    @component.output_types(embeddings=List[List[float]], meta=Dict[str, Any])
+    async def run_async(self, inputs: List[List[Any]]):
+        """
+        Embed a list of multimodal inputs asynchronously.
+
+        Batches are dispatched concurrently through the VoyageAI `AsyncClient`, so pipelines running on an event
+        loop do not block a worker thread on the network.
+
+        :param inputs:
+            A list of input rows, each a list of content items (strings, PIL images, `ByteStream`s, or videos)
+            to interleave into one multimodal document.
+
+        :returns:
+            A dictionary with the following keys:
+            - `embeddings`: The embeddings, one per input row. A `(num_inputs, dim)` float32 numpy array when
+              `return_numpy` is set, nested Python lists otherwise.
+            - `meta`: Information about the usage of the model.
+        """
+        if type(inputs) is not list or (inputs and type(inputs[0]) is not list):
+            msg = (
+                "VoyageMultimodalEmbedder expects a list of lists of content items as input."
+                " In case you want to embed plain strings, please use the VoyageTextEmbedder."
+            )
+            raise TypeError(msg)
+
+        meta: Dict[str, Any] = {"text_tokens": 0, "image_pixels": 0, "video_pixels": 0, "total_tokens": 0}
+        if not inputs:
+            return {"embeddings": [], "meta": meta}
+
+        # Text-only inputs (the common case) need no conversion at all; one short-circuiting scan is cheaper
+        # than rebuilding the nested structure through the dispatch table.
+        if all(type(item) is str for row in inputs for item in row):
+            prepared = inputs
+        else:
+            prepared = self._prepare_inputs(inputs)
+
+        if self._cache is not None:
+            return await self._run_with_cache_async(self._cache, prepared, meta)
+
+        return await self._embed_prepared_async(prepared, meta)
+
+    async def _embed_prepared_async(self, prepared: List[List[Any]], meta: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Async counterpart of `_embed_prepared`: batches are dispatched concurrently with `asyncio.gather` while
+        a semaphore caps the in-flight requests at `max_concurrent_requests`, like the sync thread pool.
+        """
+        semaphore = asyncio.Semaphore(max(self.max_concurrent_requests, 1))
+
+        async def embed_single_batch(batch: List[List[Any]]):
+            async with semaphore:
+                return await self.async_client.multimodal_embed(
+                    inputs=batch,
+                    model=self.model,
+                    input_type=self.input_type,
+                    truncation=self.truncate,
+                )
+
+        responses = await asyncio.gather(*(embed_single_batch(batch) for batch in self._pack_batches(prepared)))
+
+        return self._merge_responses(responses, num_inputs=len(prepared), meta=meta)
+
+    async def _run_with_cache_async(
+        self, cache: EmbeddingCache, prepared: List[List[Any]], meta: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Async counterpart of `_run_with_cache`: serve rows from the persistent cache where possible, embedding
+        and persisting only the misses.
+        """
+        keys = [self._cache_key(row) for row in prepared]
+        found = cache.get_many(keys)
+        misses = {key: row for key, row in zip(keys, prepared) if key not in found}
+        if misses:
+            miss_result = await self._embed_prepared_async(list(misses.values()), meta)
+            new_entries = dict(zip(misses, miss_result["embeddings"]))
+            cache.set_many(new_entries)
+            found.update(new_entries)
+
+        embeddings: Any = [found[key] for key in keys]
+        if self.return_numpy:
+            embeddings = np.asarray(embeddings, dtype=np.float32)
+        return {"embeddings": embeddings, "meta": meta}
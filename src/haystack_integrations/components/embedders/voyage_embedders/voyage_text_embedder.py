@@ -1,9 +1,55 @@
+import hashlib
 import os
-from typing import Any, Dict, List, Optional
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
 
+import numpy as np
 from haystack import component, default_from_dict, default_to_dict
 from haystack.utils import Secret, deserialize_secrets_inplace
-from voyageai import Client
+
+from haystack_integrations.components.embedders.voyage_embedders.cache import EmbeddingCache
+from haystack_integrations.components.embedders.voyage_embedders.utils import get_client
+
+_SKETCH_DIM = 256
+
+
+def _quantize_embedding(embedding: List[float]) -> Tuple[float, np.ndarray]:
+    """
+    Pack an embedding into a per-vector scale plus an int8 array.
+
+    A 1024-dimension vector then costs ~1 KB in the cache instead of ~28 KB as a list of boxed Python floats,
+    at the price of a worst-case error of one scale step per component.
+    """
+    vec = np.asarray(embedding, dtype=np.float32)
+    scale = float(np.abs(vec).max()) / 127.0
+    if scale == 0.0:
+        return 0.0, np.zeros(vec.shape[0], dtype=np.int8)
+    return scale, np.clip(np.round(vec / scale), -128, 127).astype(np.int8)
+
+
+def _dequantize_embedding(scale: float, quantized: np.ndarray) -> List[float]:
+    return (quantized.astype(np.float32) * scale).tolist()
+
+
+def _text_sketch(text: str) -> np.ndarray:
+    """
+    Build a cheap local character-trigram hashing sketch of a text.
+
+    The sketch is only used to compare texts against cached entries - it never goes to the API - so it trades
+    accuracy for being computable in microseconds without any model. Case and whitespace are normalized first,
+    making the sketch robust to the formatting variants a semantic cache is meant to absorb.
+    """
+    vec = np.zeros(_SKETCH_DIM, dtype=np.float32)
+    normalized = " ".join(text.lower().split())
+    for i in range(len(normalized) - 2):
+        vec[zlib.crc32(normalized[i : i + 3].encode("utf-8")) % _SKETCH_DIM] += 1.0
+    norm = np.linalg.norm(vec)
+    if norm > 0:
+        vec /= norm
+    return vec
 
 
 @component
@@ -33,8 +79,17 @@ class VoyageTextEmbedder:
         truncate: Optional[bool] = None,
         prefix: str = "",
         suffix: str = "",
+        cache_enabled: bool = False,  # noqa
+        cache_size: int = 1024,
+        cache_quantize: bool = True,  # noqa
+        semantic_threshold: Optional[float] = None,
+        semantic_cache_size: int = 1024,
+        cache_path: Optional[Union[str, Path]] = None,
+        return_numpy: bool = False,  # noqa
+        batch_size: int = 128,
         timeout: Optional[int] = None,
         max_retries: Optional[int] = None,
+        max_concurrent_batches: int = 4,
     ):
         """
         Create an VoyageTextEmbedder component.
@@ -65,12 +120,42 @@ class VoyageTextEmbedder:
             A string to add to the beginning of each text.
         :param suffix:
             A string to add to the end of each text.
+        :param cache_enabled:
+            Whether to keep an in-memory LRU cache of embeddings. Repeated calls with the same text (under the
+            same model settings) are then answered without an API request. Defaults to `False`.
+        :param cache_size:
+            Maximum number of embeddings kept in the in-memory cache. The least recently used entry is evicted
+            when the cache is full.
+        :param cache_quantize:
+            Whether to store in-memory cache entries quantized to int8 with a per-vector scale, quartering the
+            cache footprint compared to float32 at a small precision cost (at most one scale step per
+            component). Set to `False` to cache exact float embeddings. Defaults to `True`.
+        :param semantic_threshold:
+            Cosine-similarity threshold for the semantic cache tier. When set, texts whose local hashing sketch
+            is at least this similar to a previously embedded text reuse its embedding, so near-duplicates
+            (casing, punctuation, whitespace variants) skip the API call. Defaults to `None`, which disables the
+            tier; `0.86` is a reasonable starting point.
+        :param semantic_cache_size:
+            Maximum number of entries in the semantic cache tier; the oldest entry is dropped when full.
+        :param cache_path:
+            Path to a SQLite file used as a persistent embedding cache. Unlike the in-memory cache, entries
+            survive process exit, so re-running over a stable corpus costs no tokens. Texts are keyed together
+            with the model, prefix, suffix, input type and truncation. Defaults to `None` (no disk caching).
+        :param return_numpy:
+            Whether to return embeddings as float32 numpy arrays instead of Python lists: `run` then returns a
+            `(dim,)` array and `run_batch` one contiguous `(N, dim)` matrix, which downstream numeric code can
+            slice without per-element boxing. Leave `False` if downstream components require plain lists.
+        :param batch_size:
+            Maximum number of texts sent per request by `run_batch`.
         :param timeout:
             Timeout for VoyageAI Client calls, if not set it is inferred from the `VOYAGE_TIMEOUT` environment variable
             or set to 30.
         :param max_retries:
             Maximum retries to establish contact with VoyageAI if it returns an internal error, if not set it is
             inferred from the `VOYAGE_MAX_RETRIES` environment variable or set to 5.
+        :param max_concurrent_batches:
+            Maximum number of `run_batch` requests kept in flight at once when the input spans multiple batches.
+            Set to 1 to dispatch batches sequentially.
         """
         self.api_key = api_key
         self.model = model
@@ -78,13 +163,28 @@ class VoyageTextEmbedder:
         self.truncate = truncate
         self.prefix = prefix
         self.suffix = suffix
+        self.cache_enabled = cache_enabled
+        self.cache_size = cache_size
+        self.cache_quantize = cache_quantize
+        self.semantic_threshold = semantic_threshold
+        self.semantic_cache_size = semantic_cache_size
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.return_numpy = return_numpy
+        self.batch_size = batch_size
+        self.max_concurrent_batches = max_concurrent_batches
+        self._cache: "OrderedDict[Tuple[str, Optional[str], str], Any]" = OrderedDict()
+        self._disk_cache: Optional[EmbeddingCache] = EmbeddingCache(self.cache_path) if self.cache_path else None
+        self._semantic_index: Optional[np.ndarray] = None
+        self._semantic_entries: List[List[float]] = []
 
         if timeout is None:
             timeout = int(os.environ.get("VOYAGE_TIMEOUT", 30))
         if max_retries is None:
             max_retries = int(os.environ.get("VOYAGE_MAX_RETRIES", 5))
+        self.timeout = timeout
+        self.max_retries = max_retries
 
-        self.client = Client(api_key=api_key.resolve_value(), max_retries=max_retries, timeout=timeout)
+        self.client = get_client(api_key=api_key.resolve_value(), timeout=timeout, max_retries=max_retries)
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -100,6 +200,15 @@ class VoyageTextEmbedder:
             truncate=self.truncate,
             prefix=self.prefix,
             suffix=self.suffix,
+            cache_enabled=self.cache_enabled,
+            cache_size=self.cache_size,
+            cache_quantize=self.cache_quantize,
+            semantic_threshold=self.semantic_threshold,
+            semantic_cache_size=self.semantic_cache_size,
+            cache_path=str(self.cache_path) if self.cache_path else None,
+            return_numpy=self.return_numpy,
+            batch_size=self.batch_size,
+            max_concurrent_batches=self.max_concurrent_batches,
             api_key=self.api_key.to_dict(),
         )
 
@@ -116,6 +225,46 @@ class VoyageTextEmbedder:
         deserialize_secrets_inplace(data["init_parameters"], keys=["api_key"])
         return default_from_dict(cls, data)
 
+    def _format_embedding(self, embedding: List[float]) -> Any:
+        """
+        Convert an embedding to the configured output representation in one shot.
+        """
+        if self.return_numpy:
+            return np.asarray(embedding, dtype=np.float32)
+        return embedding
+
+    def _cache_key(self, text_to_embed: str) -> str:
+        """
+        Hash the formatted text together with every parameter that affects the embedding value.
+        """
+        payload = f"{text_to_embed}|{self.model}|{self.input_type}|{self.truncate}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _semantic_lookup(self, sketch: np.ndarray) -> Optional[List[float]]:
+        """
+        Return the embedding of the most similar cached text if it clears the threshold, `None` otherwise.
+        """
+        if self._semantic_index is None or not np.any(sketch):
+            return None
+        # one BLAS matrix-vector product against the (normalized) cached sketches
+        similarities = self._semantic_index @ sketch
+        best = int(np.argmax(similarities))
+        if similarities[best] >= self.semantic_threshold:
+            return self._semantic_entries[best]
+        return None
+
+    def _semantic_insert(self, sketch: np.ndarray, embedding: List[float]) -> None:
+        if not np.any(sketch):
+            return
+        if self._semantic_index is None:
+            self._semantic_index = sketch[np.newaxis, :]
+        else:
+            self._semantic_index = np.vstack((self._semantic_index, sketch))
+        self._semantic_entries.append(embedding)
+        if len(self._semantic_entries) > self.semantic_cache_size:
+            self._semantic_index = self._semantic_index[1:]
+            self._semantic_entries.pop(0)
+
     @component.output_types(embedding=List[float], meta=Dict[str, Any])
     def run(self, text: str):
         """
@@ -136,7 +285,31 @@ class VoyageTextEmbedder:
             )
             raise TypeError(msg)
 
-        text_to_embed = self.prefix + text + self.suffix
+        # single-allocation f-string instead of the two intermediate strings of chained concatenation
+        text_to_embed = f"{self.prefix}{text}{self.suffix}"
+
+        if self.cache_enabled:
+            key = (self.model, self.input_type, text_to_embed)
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                hit = _dequantize_embedding(*cached) if self.cache_quantize else list(cached)
+                return {"embedding": self._format_embedding(hit), "meta": {"total_tokens": 0}}
+
+        disk_key = None
+        disk_cache = self._disk_cache
+        if disk_cache is not None:
+            disk_key = self._cache_key(text_to_embed)
+            persisted = disk_cache.get_many([disk_key]).get(disk_key)
+            if persisted is not None:
+                return {"embedding": self._format_embedding(persisted), "meta": {"total_tokens": 0}}
+
+        sketch = None
+        if self.semantic_threshold is not None:
+            sketch = _text_sketch(text_to_embed)
+            near_match = self._semantic_lookup(sketch)
+            if near_match is not None:
+                return {"embedding": self._format_embedding(list(near_match)), "meta": {"total_tokens": 0}}
 
         response = self.client.embed(
             texts=[text_to_embed], model=self.model, input_type=self.input_type, truncation=self.truncate
@@ -144,4 +317,65 @@ class VoyageTextEmbedder:
         embedding = response.embeddings[0]
         meta = {"total_tokens": response.total_tokens}
 
-        return {"embedding": embedding, "meta": meta}
+        if self.cache_enabled:
+            self._cache[key] = _quantize_embedding(embedding) if self.cache_quantize else embedding
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        if disk_cache is not None and disk_key is not None:
+            disk_cache.set_many({disk_key: embedding})
+        if sketch is not None:
+            self._semantic_insert(sketch, embedding)
+
+        return {"embedding": self._format_embedding(embedding), "meta": meta}
+
+    def run_batch(self, texts: List[str]) -> Dict[str, Any]:
+        """
+        Embed a list of strings with a single API request.
+
+        Compared to calling `run` once per text, this saves one network round-trip per additional text. For
+        embedding Documents, prefer the VoyageDocumentEmbedder, which also handles metadata and batch limits.
+
+        :param texts:
+            Texts to embed.
+
+        :returns:
+            A dictionary with the following keys:
+            - `embeddings`: The embeddings of the input texts, in input order.
+            - `meta`: Information about the usage of the model.
+        """
+        if not isinstance(texts, list) or (texts and not isinstance(texts[0], str)):
+            msg = (
+                "VoyageTextEmbedder.run_batch expects a list of strings as input. "
+                "In case you want to embed a list of Documents, please use the VoyageDocumentEmbedder."
+            )
+            raise TypeError(msg)
+
+        if not texts:
+            return {"embeddings": [], "meta": {"total_tokens": 0}}
+
+        texts_to_embed = [f"{self.prefix}{text}{self.suffix}" for text in texts]
+        batches = [texts_to_embed[i : i + self.batch_size] for i in range(0, len(texts_to_embed), self.batch_size)]
+
+        if len(batches) == 1 or self.max_concurrent_batches <= 1:
+            responses = [self._embed_single_batch(batch) for batch in batches]
+        else:
+            max_workers = min(self.max_concurrent_batches, len(batches))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                responses = list(executor.map(self._embed_single_batch, batches))
+
+        embeddings: List[List[float]] = []
+        total_tokens = 0
+        for response in responses:
+            embeddings.extend(response.embeddings)
+            total_tokens += response.total_tokens
+
+        if self.return_numpy:
+            # one contiguous (N, dim) float32 matrix instead of N boxed-float lists
+            return {"embeddings": np.asarray(embeddings, dtype=np.float32), "meta": {"total_tokens": total_tokens}}
+        return {"embeddings": embeddings, "meta": {"total_tokens": total_tokens}}
+
+    def _embed_single_batch(self, batch: List[str]):
+        """
+        Send one batch of formatted texts to the embedding endpoint.
+        """
+        return self.client.embed(texts=batch, model=self.model, input_type=self.input_type, truncation=self.truncate)
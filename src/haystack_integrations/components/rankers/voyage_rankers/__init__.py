@@ -0,0 +1,7 @@
+# SPDX-FileCopyrightText: 2023-present Ashwin Mathur <>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from haystack_integrations.components.rankers.voyage_rankers.voyage_text_reranker import VoyageRanker
+
+__all__ = ["VoyageRanker"]
@@ -0,0 +1,181 @@
+import os
+from typing import Any, Dict, List, Optional
+
+from haystack import Document, component, default_from_dict, default_to_dict
+from haystack.utils import Secret, deserialize_secrets_inplace
+
+from haystack_integrations.components.embedders.voyage_embedders.utils import get_client
+
+
+@component
+class VoyageRanker:
+    """
+    A component for reranking Documents by their relevance to a query using Voyage rerank models.
+
+    Usage example:
+    ```python
+    from haystack import Document
+    from haystack_integrations.components.rankers.voyage_rankers import VoyageRanker
+
+    ranker = VoyageRanker(top_k=2)
+
+    docs = [Document(content="Paris"), Document(content="Berlin")]
+    result = ranker.run(query="City in France", documents=docs)
+
+    # {'documents': [Document(content='Paris', score=0.93...), ...],
+    ```
+    """
+
+    def __init__(
+        self,
+        api_key: Secret = Secret.from_env_var("VOYAGE_API_KEY"),
+        model: str = "rerank-2",
+        truncate: Optional[bool] = None,
+        top_k: Optional[int] = None,
+        prefix: str = "",
+        suffix: str = "",
+        meta_fields_to_embed: Optional[List[str]] = None,
+        meta_data_separator: str = "\n",
+        timeout: Optional[int] = None,
+        max_retries: Optional[int] = None,
+    ):
+        """
+        Create a VoyageRanker component.
+
+        :param api_key:
+            The VoyageAI API key. It can be explicitly provided or automatically read from the environment variable
+            VOYAGE_API_KEY (recommended).
+        :param model:
+            The name of the Voyage rerank model to use. Defaults to "rerank-2".
+            For more details on the available models,
+            see [Voyage Rerankers documentation](https://docs.voyageai.com/docs/reranker).
+        :param truncate:
+            Whether to truncate over-length query/document pairs to fit within the context length.
+            - Defaults to `None`, which uses the API default of truncating over-length inputs.
+            - If `False`, an error will be raised if any query/document pair exceeds the context length.
+        :param top_k:
+            Maximum number of Documents to return. Defaults to `None`, which returns all input Documents
+            reranked.
+        :param prefix:
+            A string to add to the beginning of each Document text.
+        :param suffix:
+            A string to add to the end of each Document text.
+        :param meta_fields_to_embed:
+            List of meta fields that should be ranked along with the Document text.
+        :param meta_data_separator:
+            Separator used to concatenate the meta fields to the Document text.
+        :param timeout:
+            Timeout for VoyageAI Client calls, if not set it is inferred from the `VOYAGE_TIMEOUT` environment variable
+            or set to 30.
+        :param max_retries:
+            Maximum retries to establish contact with VoyageAI if it returns an internal error, if not set it is
+            inferred from the `VOYAGE_MAX_RETRIES` environment variable or set to 5.
+        """
+        self.api_key = api_key
+        self.model = model
+        self.truncate = truncate
+        self.top_k = top_k
+        self.prefix = prefix
+        self.suffix = suffix
+        self.meta_fields_to_embed = meta_fields_to_embed or []
+        self.meta_data_separator = meta_data_separator
+
+        if timeout is None:
+            timeout = int(os.environ.get("VOYAGE_TIMEOUT", 30))
+        if max_retries is None:
+            max_retries = int(os.environ.get("VOYAGE_MAX_RETRIES", 5))
+        self.timeout = timeout
+        self.max_retries = max_retries
+
+        self.client = get_client(api_key=api_key.resolve_value(), timeout=timeout, max_retries=max_retries)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Serializes the component to a dictionary.
+
+        :returns:
+            Dictionary with serialized data.
+        """
+        return default_to_dict(
+            self,
+            model=self.model,
+            truncate=self.truncate,
+            top_k=self.top_k,
+            prefix=self.prefix,
+            suffix=self.suffix,
+            meta_fields_to_embed=self.meta_fields_to_embed,
+            meta_data_separator=self.meta_data_separator,
+            api_key=self.api_key.to_dict(),
+        )
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "VoyageRanker":
+        """
+        Deserializes the component from a dictionary.
+
+        :param data:
+            Dictionary to deserialize from.
+        :returns:
+            Deserialized component.
+        """
+        deserialize_secrets_inplace(data["init_parameters"], keys=["api_key"])
+        return default_from_dict(cls, data)
+
+    def _prepare_texts_to_rank(self, documents: List[Document]) -> List[str]:
+        """
+        Prepare the texts to rank by concatenating the Document text with the metadata fields to embed.
+        """
+        texts_to_rank = []
+        for doc in documents:
+            meta_values = [
+                str(doc.meta[key]) for key in self.meta_fields_to_embed if key in doc.meta and doc.meta[key] is not None
+            ]
+            text = self.meta_data_separator.join([*meta_values, doc.content or ""])
+            texts_to_rank.append(f"{self.prefix}{text}{self.suffix}")
+        return texts_to_rank
+
+    @component.output_types(documents=List[Document], meta=Dict[str, Any])
+    def run(self, query: str, documents: List[Document], top_k: Optional[int] = None):
+        """
+        Rerank a list of Documents by their relevance to the query.
+
+        :param query:
+            The query to rank the Documents against.
+        :param documents:
+            Documents to rank.
+        :param top_k:
+            Maximum number of Documents to return, overriding the value set at initialization.
+
+        :returns:
+            A dictionary with the following keys:
+            - `documents`: The input Documents ordered by descending relevance, with `score` set on each.
+            - `meta`: Information about the usage of the model.
+        """
+        if not isinstance(documents, list) or (documents and not isinstance(documents[0], Document)):
+            msg = (
+                "VoyageRanker expects a list of Documents as input. "
+                "In case you want to rank plain texts, wrap them in Documents first."
+            )
+            raise TypeError(msg)
+
+        if not documents:
+            return {"documents": [], "meta": {"total_tokens": 0}}
+
+        top_k = top_k if top_k is not None else self.top_k
+        texts_to_rank = self._prepare_texts_to_rank(documents)
+
+        response = self.client.rerank(
+            query=query,
+            documents=texts_to_rank,
+            model=self.model,
+            top_k=top_k,
+            truncation=True if self.truncate is None else self.truncate,
+        )
+
+        ranked_documents = []
+        for result in response.results:
+            doc = documents[result.index]
+            doc.score = result.relevance_score
+            ranked_documents.append(doc)
+
+        return {"documents": ranked_documents, "meta": {"total_tokens": response.total_tokens}}
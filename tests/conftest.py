@@ -0,0 +1,23 @@
+import pytest
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--no-rerank-cache",
+        action="store_true",
+        default=False,
+        help="Make the reranker integration test hit the live API even when a cached response exists.",
+    )
+
+
+@pytest.fixture(autouse=True)
+def _voyage_env(request, monkeypatch):
+    """
+    Give every unit test a fake VOYAGE_API_KEY instead of repeating monkeypatch.setenv per test.
+
+    Integration tests are left untouched so they keep using the real key from the environment. Tests that need
+    the variable absent simply delenv it; per-test monkeypatching runs after this fixture and wins.
+    """
+    if request.node.get_closest_marker("integration"):
+        return
+    monkeypatch.setenv("VOYAGE_API_KEY", "fake-api-key")
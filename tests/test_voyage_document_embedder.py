@@ -1,27 +1,76 @@
+import asyncio
 import os
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import numpy as np
 import pytest
 from haystack import Document
 from haystack.utils.auth import Secret
+from voyageai import Client
+
 from haystack_integrations.components.embedders.voyage_embedders import VoyageDocumentEmbedder
+from haystack_integrations.components.embedders.voyage_embedders.utils import get_client
+
+_FIXED_EMBEDDINGS = np.random.default_rng(0).random((256, 1024), dtype=np.float64).tolist()
+
+
+def mock_voyageai_response(texts, **kwargs):  # noqa: ARG001
+    response = MagicMock()
+    response.embeddings = _FIXED_EMBEDDINGS[: len(texts)]
+    response.total_tokens = 3 * len(texts)
+    return response
+
+
+def mock_voyageai_tokenize(list_of_text, model=None):  # noqa: ARG001
+    return [[1] for _ in list_of_text]
+
+
+@pytest.fixture(scope="module")
+def shared_voyage_client():
+    client = MagicMock(spec=Client)
+    client.api_key = "fake-api-key"
+    return client
+
+
+@pytest.fixture(autouse=True)
+def patch_voyage_client(request, shared_voyage_client, monkeypatch):
+    # Unit tests never talk to the API, so they all share one mocked client instead of paying for a fresh
+    # voyageai.Client (HTTP session, TLS context) per constructed embedder.
+    if request.node.get_closest_marker("integration"):
+        return
+    shared_voyage_client.reset_mock(side_effect=True)
+    monkeypatch.setattr(
+        "haystack_integrations.components.embedders.voyage_embedders.voyage_document_embedder.get_client",
+        lambda **kwargs: shared_voyage_client,  # noqa: ARG005
+    )
+
+
+@pytest.fixture(scope="module")
+def default_embedder():
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("VOYAGE_API_KEY", "fake-api-key")
+        yield VoyageDocumentEmbedder()
 
 
 class TestVoyageDocumentEmbedder:
     @pytest.mark.unit
-    def test_init_default(self, monkeypatch):
-        monkeypatch.setenv("VOYAGE_API_KEY", "fake-api-key")
-        embedder = VoyageDocumentEmbedder()
+    def test_init_default(self, default_embedder):
+        embedder = default_embedder
 
         assert embedder.client.api_key == "fake-api-key"
         assert embedder.model == "voyage-2"
         assert embedder.input_type == "document"
         assert embedder.truncate is None
+        assert embedder.output_dimension is None
+        assert embedder.output_dtype is None
         assert embedder.prefix == ""
         assert embedder.suffix == ""
         assert embedder.batch_size == 32
         assert embedder.progress_bar is True
         assert embedder.metadata_fields_to_embed == []
         assert embedder.embedding_separator == "\n"
+        assert embedder.deduplicate is True
+        assert embedder.max_concurrent_requests == 5
 
     @pytest.mark.unit
     def test_init_with_parameters(self):
@@ -30,24 +79,30 @@ class TestVoyageDocumentEmbedder:
             model="model",
             input_type="query",
             truncate=True,
+            output_dimension=1024,
+            output_dtype="int8",
             prefix="prefix",
             suffix="suffix",
             batch_size=4,
             progress_bar=False,
             metadata_fields_to_embed=["test_field"],
             embedding_separator=" | ",
+            deduplicate=False,
         )
 
         assert embedder.client.api_key == "fake-api-key"
         assert embedder.model == "model"
         assert embedder.input_type == "query"
         assert embedder.truncate is True
+        assert embedder.output_dimension == 1024
+        assert embedder.output_dtype == "int8"
         assert embedder.prefix == "prefix"
         assert embedder.suffix == "suffix"
         assert embedder.batch_size == 4
         assert embedder.progress_bar is False
         assert embedder.metadata_fields_to_embed == ["test_field"]
         assert embedder.embedding_separator == " | "
+        assert embedder.deduplicate is False
 
     @pytest.mark.unit
     def test_init_fail_wo_api_key(self, monkeypatch):
@@ -56,10 +111,8 @@ class TestVoyageDocumentEmbedder:
             VoyageDocumentEmbedder()
 
     @pytest.mark.unit
-    def test_to_dict(self, monkeypatch):
-        monkeypatch.setenv("VOYAGE_API_KEY", "fake-api-key")
-        component = VoyageDocumentEmbedder()
-        data = component.to_dict()
+    def test_to_dict(self, default_embedder):
+        data = default_embedder.to_dict()
         assert data == {
             "type": "haystack_integrations.components.embedders.voyage_embedders.voyage_document_embedder."
             "VoyageDocumentEmbedder",
@@ -68,18 +121,24 @@ class TestVoyageDocumentEmbedder:
                 "model": "voyage-2",
                 "input_type": "document",
                 "truncate": None,
+                "output_dimension": None,
+                "output_dtype": None,
                 "prefix": "",
                 "suffix": "",
                 "batch_size": 32,
                 "progress_bar": True,
                 "metadata_fields_to_embed": [],
                 "embedding_separator": "\n",
+                "deduplicate": True,
+                "cache_path": None,
+                "return_numpy": False,
+                "max_concurrent_requests": 5,
+                "max_tokens_per_request": None,
             },
         }
 
     @pytest.mark.unit
-    def test_from_dict(self, monkeypatch):
-        monkeypatch.setenv("VOYAGE_API_KEY", "fake-api-key")
+    def test_from_dict(self):
         data = {
             "type": "haystack_integrations.components.embedders.voyage_embedders.voyage_document_embedder."
             "VoyageDocumentEmbedder",
@@ -88,12 +147,19 @@ class TestVoyageDocumentEmbedder:
                 "model": "voyage-2",
                 "input_type": "document",
                 "truncate": None,
+                "output_dimension": None,
+                "output_dtype": None,
                 "prefix": "",
                 "suffix": "",
                 "batch_size": 32,
                 "progress_bar": True,
                 "metadata_fields_to_embed": [],
                 "embedding_separator": "\n",
+                "deduplicate": True,
+                "cache_path": None,
+                "return_numpy": False,
+                "max_concurrent_requests": 5,
+                "max_tokens_per_request": None,
             },
         }
 
@@ -103,12 +169,16 @@ class TestVoyageDocumentEmbedder:
         assert embedder.model == "voyage-2"
         assert embedder.input_type == "document"
         assert embedder.truncate is None
+        assert embedder.output_dimension is None
+        assert embedder.output_dtype is None
         assert embedder.prefix == ""
         assert embedder.suffix == ""
         assert embedder.batch_size == 32
         assert embedder.progress_bar is True
         assert embedder.metadata_fields_to_embed == []
         assert embedder.embedding_separator == "\n"
+        assert embedder.deduplicate is True
+        assert embedder.max_concurrent_requests == 5
 
     @pytest.mark.unit
     def test_to_dict_with_custom_init_parameters(self, monkeypatch):
@@ -118,12 +188,15 @@ class TestVoyageDocumentEmbedder:
             model="model",
             input_type="query",
             truncate=True,
+            output_dimension=1024,
+            output_dtype="int8",
             prefix="prefix",
             suffix="suffix",
             batch_size=4,
             progress_bar=False,
             metadata_fields_to_embed=["test_field"],
             embedding_separator=" | ",
+            deduplicate=False,
         )
         data = component.to_dict()
         assert data == {
@@ -134,12 +207,19 @@ class TestVoyageDocumentEmbedder:
                 "model": "model",
                 "input_type": "query",
                 "truncate": True,
+                "output_dimension": 1024,
+                "output_dtype": "int8",
                 "prefix": "prefix",
                 "suffix": "suffix",
                 "batch_size": 4,
                 "progress_bar": False,
                 "metadata_fields_to_embed": ["test_field"],
                 "embedding_separator": " | ",
+                "deduplicate": False,
+                "cache_path": None,
+                "return_numpy": False,
+                "max_concurrent_requests": 5,
+                "max_tokens_per_request": None,
             },
         }
 
@@ -154,12 +234,19 @@ class TestVoyageDocumentEmbedder:
                 "model": "model",
                 "input_type": "query",
                 "truncate": True,
+                "output_dimension": 1024,
+                "output_dtype": "int8",
                 "prefix": "prefix",
                 "suffix": "suffix",
                 "batch_size": 4,
                 "progress_bar": False,
                 "metadata_fields_to_embed": ["test_field"],
                 "embedding_separator": " | ",
+                "deduplicate": False,
+                "cache_path": None,
+                "return_numpy": False,
+                "max_concurrent_requests": 2,
+                "max_tokens_per_request": 10_000,
             },
         }
 
@@ -169,12 +256,17 @@ class TestVoyageDocumentEmbedder:
         assert embedder.model == "model"
         assert embedder.input_type == "query"
         assert embedder.truncate is True
+        assert embedder.output_dimension == 1024
+        assert embedder.output_dtype == "int8"
         assert embedder.prefix == "prefix"
         assert embedder.suffix == "suffix"
         assert embedder.batch_size == 4
         assert embedder.progress_bar is False
         assert embedder.metadata_fields_to_embed == ["test_field"]
         assert embedder.embedding_separator == " | "
+        assert embedder.deduplicate is False
+        assert embedder.max_concurrent_requests == 2
+        assert embedder.max_tokens_per_request == 10_000
 
     @pytest.mark.unit
     def test_prepare_texts_to_embed_w_metadata(self):
@@ -239,6 +331,274 @@ class TestVoyageDocumentEmbedder:
         assert result["documents"] is not None
         assert not result["documents"]  # empty list
 
+    @pytest.mark.unit
+    def test_get_client_is_shared(self):
+        get_client.cache_clear()
+        try:
+            client_one = get_client("fake-api-key", 30, 5)
+            client_two = get_client("fake-api-key", 30, 5)
+            other_client = get_client("other-api-key", 30, 5)
+
+            assert client_one is client_two
+            assert other_client is not client_one
+        finally:
+            get_client.cache_clear()
+
+    @pytest.mark.unit
+    def test_embed_batch(self):
+        texts = [f"text {i}" for i in range(5)]
+        embedder = VoyageDocumentEmbedder(api_key=Secret.from_token("fake-api-key"), progress_bar=False)
+
+        with patch.object(embedder.client, "tokenize", side_effect=mock_voyageai_tokenize):
+            with patch.object(embedder.client, "embed", side_effect=mock_voyageai_response):
+                embeddings, meta = embedder._embed_batch(texts_to_embed=texts, batch_size=2)
+
+        assert isinstance(embeddings, list)
+        assert len(embeddings) == len(texts)
+        for embedding in embeddings:
+            assert isinstance(embedding, list)
+            arr = np.asarray(embedding)
+            assert arr.dtype.kind == "f"
+            assert arr.shape == (1024,)
+        assert meta["total_tokens"] == 3 * len(texts)
+
+    @pytest.mark.unit
+    def test_run_with_mocked_api(self):
+        docs = [Document(content=f"document number {i}") for i in range(5)]
+        embedder = VoyageDocumentEmbedder(api_key=Secret.from_token("fake-api-key"), progress_bar=False)
+
+        with patch.object(embedder.client, "tokenize", side_effect=mock_voyageai_tokenize):
+            with patch.object(embedder.client, "embed", side_effect=mock_voyageai_response):
+                result = embedder.run(documents=docs)
+
+        documents_with_embeddings = result["documents"]
+
+        assert isinstance(documents_with_embeddings, list)
+        assert len(documents_with_embeddings) == len(docs)
+        for doc in documents_with_embeddings:
+            assert isinstance(doc, Document)
+            assert isinstance(doc.embedding, list)
+            arr = np.asarray(doc.embedding)
+            assert arr.dtype.kind == "f"
+            assert arr.shape == (1024,)
+        assert result["meta"]["total_tokens"] == 3 * len(docs)
+
+    @pytest.mark.unit
+    def test_embed_batch_concurrent_preserves_order(self):
+        texts = [f"text {i}" for i in range(6)]
+        embedder = VoyageDocumentEmbedder(
+            api_key=Secret.from_token("fake-api-key"), batch_size=2, max_concurrent_requests=3, progress_bar=False
+        )
+
+        def numbered_response(texts, **kwargs):  # noqa: ARG001
+            response = MagicMock()
+            response.embeddings = [[float(text.split()[-1])] * 4 for text in texts]
+            response.total_tokens = len(texts)
+            return response
+
+        with patch.object(embedder.client, "tokenize", side_effect=mock_voyageai_tokenize):
+            with patch.object(embedder.client, "embed", side_effect=numbered_response) as embed_patch:
+                embeddings, meta = embedder._embed_batch(texts_to_embed=texts, batch_size=2)
+
+        assert embed_patch.call_count == 3
+        assert embeddings == [[float(i)] * 4 for i in range(6)]
+        assert meta["total_tokens"] == 6
+
+    @pytest.mark.unit
+    def test_run_with_mocked_api_batch_processing(self):
+        docs = [Document(content=f"document number {i}") for i in range(5)]
+        embedder = VoyageDocumentEmbedder(api_key=Secret.from_token("fake-api-key"), progress_bar=False)
+
+        with patch.object(embedder.client, "tokenize", side_effect=mock_voyageai_tokenize) as tokenize_patch:
+            with patch.object(embedder.client, "embed", side_effect=mock_voyageai_response) as embed_patch:
+                embedder.run(documents=docs)
+
+        # Five documents fit in the default batch_size of 32, so a single request suffices and no
+        # tokenization pass is needed.
+        assert embed_patch.call_count == 1
+        tokenize_patch.assert_not_called()
+
+    @pytest.mark.unit
+    def test_run_max_tokens_per_request_splits_small_batch(self):
+        docs = [Document(content=f"document number {i}") for i in range(5)]
+        embedder = VoyageDocumentEmbedder(
+            api_key=Secret.from_token("fake-api-key"), max_tokens_per_request=2, progress_bar=False
+        )
+
+        with patch.object(embedder.client, "tokenize", side_effect=mock_voyageai_tokenize):
+            with patch.object(embedder.client, "embed", side_effect=mock_voyageai_response) as embed_patch:
+                embedder.run(documents=docs)
+
+        # An explicit token cap must be enforced even when the documents fit in a single batch: at one mocked
+        # token per document, a cap of 2 packs the five documents into three requests.
+        assert embed_patch.call_count == 3
+
+    @pytest.mark.unit
+    def test_run_custom_batch_size(self):
+        docs = [Document(content=f"document number {i}") for i in range(5)]
+        embedder = VoyageDocumentEmbedder(api_key=Secret.from_token("fake-api-key"), batch_size=2, progress_bar=False)
+
+        with patch.object(embedder.client, "tokenize", side_effect=mock_voyageai_tokenize):
+            with patch.object(embedder.client, "embed", side_effect=mock_voyageai_response) as embed_patch:
+                result = embedder.run(documents=docs)
+
+        assert embed_patch.call_count == 3
+
+        documents_with_embeddings = result["documents"]
+
+        assert isinstance(documents_with_embeddings, list)
+        assert len(documents_with_embeddings) == len(docs)
+        for doc in documents_with_embeddings:
+            assert isinstance(doc, Document)
+            assert isinstance(doc.embedding, list)
+            arr = np.asarray(doc.embedding)
+            assert arr.dtype.kind == "f"
+            assert arr.shape == (1024,)
+        assert result["meta"]["total_tokens"] == 3 * len(docs)
+
+    @pytest.mark.unit
+    def test_run_async_with_mocked_api(self):
+        docs = [Document(content=f"document number {i}") for i in range(5)]
+        embedder = VoyageDocumentEmbedder(api_key=Secret.from_token("fake-api-key"), batch_size=2, progress_bar=False)
+        embedder._async_client = MagicMock()
+        embedder._async_client.embed = AsyncMock(side_effect=mock_voyageai_response)
+
+        with patch.object(embedder.client, "tokenize", side_effect=mock_voyageai_tokenize):
+            result = asyncio.run(embedder.run_async(documents=docs))
+
+        assert embedder._async_client.embed.call_count == 3
+
+        documents_with_embeddings = result["documents"]
+
+        assert isinstance(documents_with_embeddings, list)
+        assert len(documents_with_embeddings) == len(docs)
+        for doc in documents_with_embeddings:
+            assert isinstance(doc, Document)
+            assert isinstance(doc.embedding, list)
+            arr = np.asarray(doc.embedding)
+            assert arr.dtype.kind == "f"
+            assert arr.shape == (1024,)
+        assert result["meta"]["total_tokens"] == 3 * len(docs)
+
+    @pytest.mark.unit
+    def test_run_skips_already_embedded_documents(self):
+        docs = [Document(content="fresh"), Document(content="already embedded")]
+        docs[1].embedding = [0.5] * 1024
+        embedder = VoyageDocumentEmbedder(api_key=Secret.from_token("fake-api-key"), progress_bar=False)
+
+        with patch.object(embedder.client, "tokenize", side_effect=mock_voyageai_tokenize):
+            with patch.object(embedder.client, "embed", side_effect=mock_voyageai_response) as embed_patch:
+                result = embedder.run(documents=docs)
+
+        assert embed_patch.call_args.kwargs["texts"] == ["fresh"]
+        assert result["documents"][1].embedding == [0.5] * 1024
+        assert result["documents"][0].embedding is not None
+        assert result["meta"]["total_tokens"] == 3
+
+    @pytest.mark.unit
+    def test_run_deduplicates_identical_texts(self):
+        docs = [Document(content="repeated"), Document(content="unique"), Document(content="repeated")]
+        embedder = VoyageDocumentEmbedder(api_key=Secret.from_token("fake-api-key"), progress_bar=False)
+
+        with patch.object(embedder.client, "tokenize", side_effect=mock_voyageai_tokenize):
+            with patch.object(embedder.client, "embed", side_effect=mock_voyageai_response) as embed_patch:
+                result = embedder.run(documents=docs)
+
+        assert sorted(embed_patch.call_args.kwargs["texts"]) == ["repeated", "unique"]
+        assert result["documents"][0].embedding == result["documents"][2].embedding
+        assert result["documents"][0].embedding != result["documents"][1].embedding
+        assert result["meta"]["total_tokens"] == 6
+
+    @pytest.mark.unit
+    def test_run_with_persistent_cache(self, tmp_path):
+        cache_path = tmp_path / "embeddings.db"
+        embedder = VoyageDocumentEmbedder(
+            api_key=Secret.from_token("fake-api-key"), cache_path=cache_path, progress_bar=False
+        )
+
+        with patch.object(embedder.client, "tokenize", side_effect=mock_voyageai_tokenize):
+            with patch.object(embedder.client, "embed", side_effect=mock_voyageai_response) as embed_patch:
+                first = embedder.run(documents=[Document(content=f"document number {i}") for i in range(3)])
+                assert embed_patch.call_count == 1
+                second = embedder.run(documents=[Document(content=f"document number {i}") for i in range(3)])
+
+        # The second run is served entirely from the cache: no new API call, no tokens billed.
+        assert embed_patch.call_count == 1
+        assert second["meta"]["total_tokens"] == 0
+        assert first["meta"]["total_tokens"] == 9
+        for doc in second["documents"]:
+            arr = np.asarray(doc.embedding)
+            assert arr.dtype.kind == "f"
+            assert arr.shape == (1024,)
+
+    @pytest.mark.unit
+    def test_run_async_with_persistent_cache(self, tmp_path):
+        cache_path = tmp_path / "embeddings.db"
+        embedder = VoyageDocumentEmbedder(
+            api_key=Secret.from_token("fake-api-key"), cache_path=cache_path, progress_bar=False
+        )
+        embedder._async_client = MagicMock()
+        embedder._async_client.embed = AsyncMock(side_effect=mock_voyageai_response)
+
+        docs = [Document(content=f"document number {i}") for i in range(3)]
+        with patch.object(embedder.client, "tokenize", side_effect=mock_voyageai_tokenize):
+            first = asyncio.run(embedder.run_async(documents=docs))
+            assert embedder._async_client.embed.call_count == 1
+            second = asyncio.run(
+                embedder.run_async(documents=[Document(content=f"document number {i}") for i in range(3)])
+            )
+
+        # Like run, the second run_async is served entirely from the cache.
+        assert embedder._async_client.embed.call_count == 1
+        assert second["meta"]["total_tokens"] == 0
+        assert first["meta"]["total_tokens"] == 9
+
+    @pytest.mark.unit
+    def test_run_return_numpy(self):
+        docs = [Document(content=f"document number {i}") for i in range(4)]
+        embedder = VoyageDocumentEmbedder(
+            api_key=Secret.from_token("fake-api-key"), return_numpy=True, progress_bar=False
+        )
+
+        with patch.object(embedder.client, "tokenize", side_effect=mock_voyageai_tokenize):
+            with patch.object(embedder.client, "embed", side_effect=mock_voyageai_response):
+                result = embedder.run(documents=docs)
+
+        for doc in result["documents"]:
+            assert isinstance(doc.embedding, np.ndarray)
+            assert doc.embedding.dtype == np.float32
+            assert doc.embedding.shape == (1024,)
+            # Rows are views into one shared matrix, not independent copies.
+            assert doc.embedding.base is not None
+
+    @pytest.mark.unit
+    def test_run_int8(self):
+        docs = [Document(content=f"document number {i}") for i in range(5)]
+        embedder = VoyageDocumentEmbedder(
+            api_key=Secret.from_token("fake-api-key"),
+            model="voyage-3-large",
+            output_dtype="int8",
+            output_dimension=1024,
+            progress_bar=False,
+        )
+
+        def mock_int8_response(texts, **kwargs):  # noqa: ARG001
+            response = MagicMock()
+            response.embeddings = np.random.default_rng(0).integers(-128, 128, (len(texts), 1024)).tolist()
+            response.total_tokens = 3 * len(texts)
+            return response
+
+        with patch.object(embedder.client, "tokenize", side_effect=mock_voyageai_tokenize):
+            with patch.object(embedder.client, "embed", side_effect=mock_int8_response) as embed_patch:
+                result = embedder.run(documents=docs)
+
+        assert embed_patch.call_args.kwargs["output_dtype"] == "int8"
+        assert embed_patch.call_args.kwargs["output_dimension"] == 1024
+        for doc in result["documents"]:
+            assert isinstance(doc.embedding, np.ndarray)
+            assert doc.embedding.dtype == np.int8
+            assert doc.embedding.shape == (1024,)
+
     @pytest.mark.skipif(os.environ.get("VOYAGE_API_KEY", "") == "", reason="VOYAGE_API_KEY is not set")
     @pytest.mark.integration
     def test_run(self):
@@ -0,0 +1,350 @@
+import asyncio
+import io
+import os
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+import pytest
+from haystack.dataclasses import ByteStream
+from haystack.utils.auth import Secret
+from PIL import Image
+from voyageai import Client
+
+from haystack_integrations.components.embedders.voyage_embedders import VoyageMultimodalEmbedder
+
+_FIXED_EMBEDDINGS = np.random.default_rng(1).random((64, 1024), dtype=np.float64).tolist()
+
+
+def mock_voyageai_multimodal_response(inputs, **kwargs):  # noqa: ARG001
+    response = MagicMock()
+    response.embeddings = _FIXED_EMBEDDINGS[: len(inputs)]
+    response.text_tokens = 2 * len(inputs)
+    response.image_pixels = 0
+    response.video_pixels = 0
+    response.total_tokens = 2 * len(inputs)
+    return response
+
+
+_COMPONENT_TYPE = (
+    "haystack_integrations.components.embedders.voyage_embedders.voyage_multimodal_embedder.VoyageMultimodalEmbedder"
+)
+
+_DEFAULT_INIT_DICT = {
+    "type": _COMPONENT_TYPE,
+    "init_parameters": {
+        "api_key": {"env_vars": ["VOYAGE_API_KEY"], "strict": True, "type": "env_var"},
+        "model": "voyage-multimodal-3",
+        "input_type": None,
+        "truncate": None,
+        "batch_size": 8,
+        "max_pixels_per_batch": 20_000_000,
+        "max_chars_per_batch": 120_000,
+        "cache_path": None,
+        "return_numpy": False,
+        "progress_bar": True,
+        "max_concurrent_requests": 4,
+    },
+}
+
+_CUSTOM_INIT_DICT = {
+    "type": _COMPONENT_TYPE,
+    "init_parameters": {
+        "api_key": {"env_vars": ["VOYAGE_API_KEY"], "strict": True, "type": "env_var"},
+        "model": "model",
+        "input_type": "document",
+        "truncate": True,
+        "batch_size": 4,
+        "max_pixels_per_batch": 1_000_000,
+        "max_chars_per_batch": 5_000,
+        "cache_path": None,
+        "return_numpy": True,
+        "progress_bar": False,
+        "max_concurrent_requests": 2,
+    },
+}
+
+_SERIALIZATION_CASES = [
+    ({}, _DEFAULT_INIT_DICT),
+    (
+        {
+            "model": "model",
+            "input_type": "document",
+            "truncate": True,
+            "batch_size": 4,
+            "max_pixels_per_batch": 1_000_000,
+            "max_chars_per_batch": 5_000,
+            "return_numpy": True,
+            "progress_bar": False,
+            "max_concurrent_requests": 2,
+        },
+        _CUSTOM_INIT_DICT,
+    ),
+]
+
+
+def make_image_bytestream(color=(255, 0, 0)) -> ByteStream:
+    buffer = io.BytesIO()
+    Image.new("RGB", (4, 4), color=color).save(buffer, format="PNG")
+    return ByteStream(data=buffer.getvalue(), mime_type="image/png")
+
+
+@pytest.fixture(scope="module")
+def shared_voyage_client():
+    client = MagicMock(spec=Client)
+    client.api_key = "fake-api-key"
+    return client
+
+
+@pytest.fixture(autouse=True)
+def patch_voyage_client(request, monkeypatch, shared_voyage_client):
+    if request.node.get_closest_marker("integration"):
+        yield
+        return
+    shared_voyage_client.reset_mock(side_effect=True)
+    shared_voyage_client.multimodal_embed.side_effect = mock_voyageai_multimodal_response
+    monkeypatch.setattr(
+        "haystack_integrations.components.embedders.voyage_embedders.voyage_multimodal_embedder.get_client",
+        lambda **kwargs: shared_voyage_client,  # noqa: ARG005
+    )
+    yield
+
+
+@pytest.fixture(scope="module")
+def default_embedder(shared_voyage_client):
+    """
+    A single mocked embedder shared by tests that do not mutate embedder state, so each of them skips the
+    client-construction and Secret-resolution cost of a fresh instance.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            "haystack_integrations.components.embedders.voyage_embedders.voyage_multimodal_embedder.get_client",
+            lambda **kwargs: shared_voyage_client,  # noqa: ARG005
+        )
+        yield VoyageMultimodalEmbedder(api_key=Secret.from_token("fake-api-key"), progress_bar=False)
+
+
+class TestVoyageMultimodalEmbedder:
+    @pytest.mark.unit
+    def test_init_default(self):
+        embedder = VoyageMultimodalEmbedder()
+
+        assert embedder.client.api_key == "fake-api-key"
+        assert embedder.model == "voyage-multimodal-3"
+        assert embedder.input_type is None
+        assert embedder.truncate is None
+        assert embedder.batch_size == 8
+        assert embedder.cache_path is None
+        assert embedder.return_numpy is False
+        assert embedder.progress_bar is True
+        assert embedder.max_concurrent_requests == 4
+
+    @pytest.mark.unit
+    def test_init_with_parameters(self):
+        embedder = VoyageMultimodalEmbedder(
+            api_key=Secret.from_token("fake-api-key"),
+            model="model",
+            input_type="document",
+            truncate=True,
+            batch_size=4,
+            progress_bar=False,
+            max_concurrent_requests=2,
+        )
+        assert embedder.client.api_key == "fake-api-key"
+        assert embedder.model == "model"
+        assert embedder.input_type == "document"
+        assert embedder.truncate is True
+        assert embedder.batch_size == 4
+        assert embedder.progress_bar is False
+        assert embedder.max_concurrent_requests == 2
+
+    @pytest.mark.unit
+    def test_init_fail_wo_api_key(self, monkeypatch):
+        monkeypatch.delenv("VOYAGE_API_KEY", raising=False)
+        with pytest.raises(ValueError, match="None of the .* environment variables are set"):
+            VoyageMultimodalEmbedder()
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(("init_kwargs", "expected"), _SERIALIZATION_CASES)
+    def test_serialization_roundtrip(self, init_kwargs, expected):
+        embedder = VoyageMultimodalEmbedder(**init_kwargs)
+        data = embedder.to_dict()
+        assert data == expected
+
+        restored = VoyageMultimodalEmbedder.from_dict(data)
+        assert restored.client.api_key == "fake-api-key"
+        assert restored.to_dict() == expected
+
+    @pytest.mark.unit
+    def test_convert_content_item(self, default_embedder):
+        embedder = default_embedder
+
+        assert embedder._convert_content_item("some text") == "some text"
+
+        image = Image.new("RGB", (4, 4))
+        assert embedder._convert_content_item(image) is image
+
+        decoded = embedder._convert_content_item(make_image_bytestream())
+        assert isinstance(decoded, Image.Image)
+        assert decoded.size == (4, 4)
+
+        # decoding the same encoded bytes again is served from the LRU cache
+        assert embedder._convert_content_item(make_image_bytestream()) is decoded
+
+        with pytest.raises(TypeError, match="unsupported type int"):
+            embedder._convert_content_item(42)
+
+    @pytest.mark.unit
+    def test_decode_bytestream_cache_eviction(self, monkeypatch):
+        # each decoded 4x4 RGB image costs 48 pixel bytes, so a 50-byte budget holds exactly one of them
+        monkeypatch.setattr(
+            "haystack_integrations.components.embedders.voyage_embedders.voyage_multimodal_embedder."
+            "_IMAGE_CACHE_MAX_BYTES",
+            50,
+        )
+        embedder = VoyageMultimodalEmbedder(api_key=Secret.from_token("fake-api-key"), progress_bar=False)
+
+        red = embedder._convert_content_item(make_image_bytestream(color=(255, 0, 0)))
+        embedder._convert_content_item(make_image_bytestream(color=(0, 255, 0)))
+
+        # the red image was evicted to stay within budget, so converting it again decodes a fresh object
+        assert embedder._convert_content_item(make_image_bytestream(color=(255, 0, 0))) is not red
+        assert len(embedder._image_cache) == 1
+
+    @pytest.mark.unit
+    def test_convert_content_item_video(self, default_embedder):
+        from voyageai.video_utils import Video
+
+        video = MagicMock(spec=Video)
+        assert default_embedder._convert_content_item(video) is video
+
+    @pytest.mark.unit
+    def test_run_with_mocked_api(self, shared_voyage_client, default_embedder):
+        embedder = default_embedder
+
+        inputs = [["The food was delicious"], ["A photo of a banana", make_image_bytestream()]]
+        result = embedder.run(inputs=inputs)
+
+        assert shared_voyage_client.multimodal_embed.call_count == 1
+        assert result["embeddings"] == _FIXED_EMBEDDINGS[:2]
+        assert result["meta"] == {"text_tokens": 4, "image_pixels": 0, "video_pixels": 0, "total_tokens": 4}
+
+    @pytest.mark.unit
+    def test_run_concurrent_preserves_order(self, shared_voyage_client):
+        embedder = VoyageMultimodalEmbedder(
+            api_key=Secret.from_token("fake-api-key"), batch_size=2, max_concurrent_requests=3, progress_bar=False
+        )
+
+        inputs = [[f"text {i}"] for i in range(6)]
+        result = embedder.run(inputs=inputs)
+
+        assert shared_voyage_client.multimodal_embed.call_count == 3
+        assert result["embeddings"] == _FIXED_EMBEDDINGS[:2] * 3
+        assert result["meta"]["total_tokens"] == 12
+
+    @pytest.mark.unit
+    def test_run_text_only_skips_conversion(self, default_embedder):
+        with patch.object(default_embedder, "_prepare_inputs") as prepare_patch:
+            result = default_embedder.run(inputs=[["some text"], ["more text"]])
+
+        prepare_patch.assert_not_called()
+        assert result["embeddings"] == _FIXED_EMBEDDINGS[:2]
+
+    @pytest.mark.unit
+    def test_run_packs_batches_by_char_budget(self, shared_voyage_client):
+        embedder = VoyageMultimodalEmbedder(
+            api_key=Secret.from_token("fake-api-key"), max_chars_per_batch=8, progress_bar=False
+        )
+
+        # each row carries 5 characters, so only one row fits per request under an 8-char budget
+        result = embedder.run(inputs=[[f"row {i}"] for i in range(4)])
+
+        assert shared_voyage_client.multimodal_embed.call_count == 4
+        assert result["embeddings"] == _FIXED_EMBEDDINGS[:1] * 4
+
+    @pytest.mark.unit
+    def test_run_async_with_mocked_api(self):
+        embedder = VoyageMultimodalEmbedder(api_key=Secret.from_token("fake-api-key"), batch_size=2, progress_bar=False)
+        embedder._async_client = MagicMock()
+        embedder._async_client.multimodal_embed = AsyncMock(side_effect=mock_voyageai_multimodal_response)
+
+        inputs = [[f"text {i}"] for i in range(6)]
+        result = asyncio.run(embedder.run_async(inputs=inputs))
+
+        assert embedder._async_client.multimodal_embed.call_count == 3
+        assert result["embeddings"] == _FIXED_EMBEDDINGS[:2] * 3
+        assert result["meta"]["total_tokens"] == 12
+
+    @pytest.mark.unit
+    def test_run_with_persistent_cache(self, tmp_path, shared_voyage_client):
+        cache_path = tmp_path / "multimodal_cache.db"
+        inputs = [["The food was delicious"], ["A photo of a banana", make_image_bytestream()]]
+
+        embedder = VoyageMultimodalEmbedder(
+            api_key=Secret.from_token("fake-api-key"), cache_path=cache_path, progress_bar=False
+        )
+        first = embedder.run(inputs=inputs)
+        assert shared_voyage_client.multimodal_embed.call_count == 1
+
+        second = embedder.run(inputs=inputs)
+        assert shared_voyage_client.multimodal_embed.call_count == 1
+        assert second["meta"]["total_tokens"] == 0
+        assert np.allclose(np.asarray(second["embeddings"]), np.asarray(first["embeddings"]))
+
+    @pytest.mark.unit
+    def test_run_async_with_persistent_cache(self, tmp_path):
+        cache_path = tmp_path / "multimodal_cache.db"
+        embedder = VoyageMultimodalEmbedder(
+            api_key=Secret.from_token("fake-api-key"), cache_path=cache_path, progress_bar=False
+        )
+        embedder._async_client = MagicMock()
+        embedder._async_client.multimodal_embed = AsyncMock(side_effect=mock_voyageai_multimodal_response)
+
+        inputs = [["The food was delicious"], ["A photo of a banana", make_image_bytestream()]]
+        first = asyncio.run(embedder.run_async(inputs=inputs))
+        assert embedder._async_client.multimodal_embed.call_count == 1
+
+        # Like run, the second run_async is served entirely from the cache.
+        second = asyncio.run(embedder.run_async(inputs=inputs))
+        assert embedder._async_client.multimodal_embed.call_count == 1
+        assert second["meta"]["total_tokens"] == 0
+        assert np.allclose(np.asarray(second["embeddings"]), np.asarray(first["embeddings"]))
+
+    @pytest.mark.unit
+    def test_run_return_numpy(self):
+        embedder = VoyageMultimodalEmbedder(
+            api_key=Secret.from_token("fake-api-key"), batch_size=2, return_numpy=True, progress_bar=False
+        )
+
+        result = embedder.run(inputs=[[f"text {i}"] for i in range(4)])
+
+        embeddings = result["embeddings"]
+        assert isinstance(embeddings, np.ndarray)
+        assert embeddings.shape == (4, 1024)
+        assert embeddings.dtype == np.float32
+        assert np.allclose(embeddings, np.asarray(_FIXED_EMBEDDINGS[:2] * 2, dtype=np.float32))
+
+    @pytest.mark.unit
+    def test_run_wrong_input_format(self, default_embedder):
+        embedder = default_embedder
+
+        with pytest.raises(TypeError, match="VoyageMultimodalEmbedder expects a list of lists"):
+            embedder.run(inputs=["text"])
+
+    @pytest.mark.unit
+    def test_run_on_empty_list(self, default_embedder):
+        embedder = default_embedder
+
+        result = embedder.run(inputs=[])
+        assert result["embeddings"] == []
+        assert result["meta"] == {"text_tokens": 0, "image_pixels": 0, "video_pixels": 0, "total_tokens": 0}
+
+    @pytest.mark.skipif(os.environ.get("VOYAGE_API_KEY", "") == "", reason="VOYAGE_API_KEY is not set")
+    @pytest.mark.integration
+    def test_run(self):
+        embedder = VoyageMultimodalEmbedder()
+        result = embedder.run(inputs=[["The food was delicious"]])
+
+        assert len(result["embeddings"]) == 1
+        assert len(result["embeddings"][0]) == 1024
+        assert all(isinstance(x, float) for x in result["embeddings"][0])
+        assert result["meta"]["total_tokens"] > 0
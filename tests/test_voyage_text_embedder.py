@@ -1,15 +1,85 @@
 import os
+from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
 from haystack.utils.auth import Secret
+
 from haystack_integrations.components.embedders.voyage_embedders import VoyageTextEmbedder
 
+# Built once at import time so mocked calls do not redo the 1024-element RNG draw and list conversion per test.
+_MOCK_EMBEDDING: list = np.random.default_rng(0).random(1024, dtype=np.float32).tolist()
+
+_COMPONENT_TYPE = "haystack_integrations.components.embedders.voyage_embedders.voyage_text_embedder.VoyageTextEmbedder"
+
+_DEFAULT_INIT_DICT = {
+    "type": _COMPONENT_TYPE,
+    "init_parameters": {
+        "api_key": {"env_vars": ["VOYAGE_API_KEY"], "strict": True, "type": "env_var"},
+        "model": "voyage-2",
+        "truncate": None,
+        "input_type": "query",
+        "prefix": "",
+        "suffix": "",
+        "cache_enabled": False,
+        "cache_size": 1024,
+        "cache_quantize": True,
+        "semantic_threshold": None,
+        "semantic_cache_size": 1024,
+        "cache_path": None,
+        "return_numpy": False,
+        "batch_size": 128,
+        "max_concurrent_batches": 4,
+    },
+}
+
+_CUSTOM_INIT_DICT = {
+    "type": _COMPONENT_TYPE,
+    "init_parameters": {
+        "api_key": {"env_vars": ["ENV_VAR"], "strict": False, "type": "env_var"},
+        "model": "model",
+        "truncate": True,
+        "input_type": "document",
+        "prefix": "prefix",
+        "suffix": "suffix",
+        "cache_enabled": False,
+        "cache_size": 1024,
+        "cache_quantize": True,
+        "semantic_threshold": None,
+        "semantic_cache_size": 1024,
+        "cache_path": None,
+        "return_numpy": False,
+        "batch_size": 128,
+        "max_concurrent_batches": 2,
+    },
+}
+
+_SERIALIZATION_CASES = [
+    ({}, _DEFAULT_INIT_DICT),
+    (
+        {
+            "api_key": Secret.from_env_var("ENV_VAR", strict=False),
+            "model": "model",
+            "truncate": True,
+            "input_type": "document",
+            "prefix": "prefix",
+            "suffix": "suffix",
+            "max_concurrent_batches": 2,
+        },
+        _CUSTOM_INIT_DICT,
+    ),
+]
+
+
+@pytest.fixture
+def default_embedder():
+    return VoyageTextEmbedder()
+
 
 class TestVoyageTextEmbedder:
     @pytest.mark.unit
-    def test_init_default(self, monkeypatch):
-        monkeypatch.setenv("VOYAGE_API_KEY", "fake-api-key")
-        embedder = VoyageTextEmbedder()
+    def test_init_default(self, default_embedder):
+        embedder = default_embedder
 
         assert embedder.client.api_key == "fake-api-key"
         assert embedder.input_type == "query"
@@ -35,6 +105,13 @@ class TestVoyageTextEmbedder:
         assert embedder.prefix == "prefix"
         assert embedder.suffix == "suffix"
 
+    @pytest.mark.unit
+    def test_client_is_shared_across_instances(self):
+        emb1 = VoyageTextEmbedder(api_key=Secret.from_token("fake-api-key"))
+        emb2 = VoyageTextEmbedder(api_key=Secret.from_token("fake-api-key"))
+
+        assert emb1.client is emb2.client
+
     @pytest.mark.unit
     def test_init_fail_wo_api_key(self, monkeypatch):
         monkeypatch.delenv("VOYAGE_API_KEY", raising=False)
@@ -42,95 +119,16 @@ class TestVoyageTextEmbedder:
             VoyageTextEmbedder()
 
     @pytest.mark.unit
-    def test_to_dict(self, monkeypatch):
-        monkeypatch.setenv("VOYAGE_API_KEY", "fake-api-key")
-        component = VoyageTextEmbedder()
-        data = component.to_dict()
-        assert data == {
-            "type": "haystack_integrations.components.embedders.voyage_embedders.voyage_text_embedder."
-            "VoyageTextEmbedder",
-            "init_parameters": {
-                "api_key": {"env_vars": ["VOYAGE_API_KEY"], "strict": True, "type": "env_var"},
-                "model": "voyage-2",
-                "truncate": None,
-                "input_type": "query",
-                "prefix": "",
-                "suffix": "",
-            },
-        }
-
-    @pytest.mark.unit
-    def test_from_dict(self, monkeypatch):
-        monkeypatch.setenv("VOYAGE_API_KEY", "fake-api-key")
-        data = {
-            "type": "haystack_integrations.components.embedders.voyage_embedders.voyage_text_embedder."
-            "VoyageTextEmbedder",
-            "init_parameters": {
-                "api_key": {"env_vars": ["VOYAGE_API_KEY"], "strict": True, "type": "env_var"},
-                "model": "voyage-2",
-                "truncate": None,
-                "input_type": "query",
-                "prefix": "",
-                "suffix": "",
-            },
-        }
-
-        embedder = VoyageTextEmbedder.from_dict(data)
-        assert embedder.client.api_key == "fake-api-key"
-        assert embedder.input_type == "query"
-        assert embedder.model == "voyage-2"
-        assert embedder.truncate is None
-        assert embedder.prefix == ""
-        assert embedder.suffix == ""
-
-    @pytest.mark.unit
-    def test_to_dict_with_custom_init_parameters(self, monkeypatch):
+    @pytest.mark.parametrize(("init_kwargs", "expected"), _SERIALIZATION_CASES)
+    def test_serialization_roundtrip(self, monkeypatch, init_kwargs, expected):
         monkeypatch.setenv("ENV_VAR", "fake-api-key")
-        component = VoyageTextEmbedder(
-            api_key=Secret.from_env_var("ENV_VAR", strict=False),
-            model="model",
-            truncate=True,
-            input_type="document",
-            prefix="prefix",
-            suffix="suffix",
-        )
-        data = component.to_dict()
-        assert data == {
-            "type": "haystack_integrations.components.embedders.voyage_embedders.voyage_text_embedder."
-            "VoyageTextEmbedder",
-            "init_parameters": {
-                "api_key": {"env_vars": ["ENV_VAR"], "strict": False, "type": "env_var"},
-                "model": "model",
-                "truncate": True,
-                "input_type": "document",
-                "prefix": "prefix",
-                "suffix": "suffix",
-            },
-        }
+        embedder = VoyageTextEmbedder(**init_kwargs)
+        data = embedder.to_dict()
+        assert data == expected
 
-    @pytest.mark.unit
-    def test_from_dict_with_custom_init_parameters(self, monkeypatch):
-        monkeypatch.setenv("ENV_VAR", "fake-api-key")
-        data = {
-            "type": "haystack_integrations.components.embedders.voyage_embedders.voyage_text_embedder."
-            "VoyageTextEmbedder",
-            "init_parameters": {
-                "api_key": {"env_vars": ["ENV_VAR"], "strict": False, "type": "env_var"},
-                "model": "model",
-                "truncate": True,
-                "input_type": "document",
-                "prefix": "prefix",
-                "suffix": "suffix",
-            },
-        }
-
-        embedder = VoyageTextEmbedder.from_dict(data)
-        assert embedder.client.api_key == "fake-api-key"
-        assert embedder.model == "model"
-        assert embedder.truncate is True
-        assert embedder.input_type == "document"
-        assert embedder.prefix == "prefix"
-        assert embedder.suffix == "suffix"
+        restored = VoyageTextEmbedder.from_dict(data)
+        assert restored.client.api_key == "fake-api-key"
+        assert restored.to_dict() == expected
 
     @pytest.mark.skipif(os.environ.get("VOYAGE_API_KEY", "") == "", reason="VOYAGE_API_KEY is not set")
     @pytest.mark.integration
@@ -144,6 +142,147 @@ class TestVoyageTextEmbedder:
         assert all(isinstance(x, float) for x in result["embedding"])
         assert result["meta"]["total_tokens"] == 8, "Total tokens does not match"
 
+    @pytest.mark.unit
+    def test_run_batch_with_mocked_api(self):
+        embedder = VoyageTextEmbedder(api_key=Secret.from_token("fake-api-key"), prefix="prefix ", suffix=" suffix")
+
+        mock_response = MagicMock()
+        mock_response.embeddings = [_MOCK_EMBEDDING] * 3
+        mock_response.total_tokens = 18
+
+        with patch.object(embedder.client, "embed", return_value=mock_response) as embed_patch:
+            result = embedder.run_batch(texts=["first", "second", "third"])
+
+        embed_patch.assert_called_once_with(
+            texts=["prefix first suffix", "prefix second suffix", "prefix third suffix"],
+            model="voyage-2",
+            input_type="query",
+            truncation=None,
+        )
+        assert result["embeddings"] == [_MOCK_EMBEDDING] * 3
+        assert result["meta"]["total_tokens"] == 18
+
+    @pytest.mark.unit
+    def test_run_batch_concurrent_preserves_order(self):
+        embedder = VoyageTextEmbedder(api_key=Secret.from_token("fake-api-key"), batch_size=1, max_concurrent_batches=3)
+
+        def respond(texts, **kwargs):  # noqa: ARG001
+            response = MagicMock()
+            response.embeddings = [[float(text[-1])] * 4 for text in texts]
+            response.total_tokens = len(texts)
+            return response
+
+        with patch.object(embedder.client, "embed", side_effect=respond) as embed_patch:
+            result = embedder.run_batch(texts=[f"text {i}" for i in range(5)])
+
+        assert embed_patch.call_count == 5
+        assert result["embeddings"] == [[float(i)] * 4 for i in range(5)]
+        assert result["meta"]["total_tokens"] == 5
+
+    @pytest.mark.unit
+    def test_run_cache_hit(self):
+        embedder = VoyageTextEmbedder(
+            api_key=Secret.from_token("fake-api-key"), cache_enabled=True, cache_quantize=False
+        )
+
+        mock_response = MagicMock()
+        mock_response.embeddings = [_MOCK_EMBEDDING]
+        mock_response.total_tokens = 6
+
+        with patch.object(embedder.client, "embed", return_value=mock_response) as embed_patch:
+            first = embedder.run(text="The food was delicious")
+            second = embedder.run(text="The food was delicious")
+
+        assert embed_patch.call_count == 1
+        assert second["embedding"] == first["embedding"]
+        assert second["meta"]["total_tokens"] == 0
+
+    @pytest.mark.unit
+    def test_run_cache_hit_quantized(self):
+        embedder = VoyageTextEmbedder(api_key=Secret.from_token("fake-api-key"), cache_enabled=True)
+
+        mock_response = MagicMock()
+        mock_response.embeddings = [_MOCK_EMBEDDING]
+        mock_response.total_tokens = 6
+
+        with patch.object(embedder.client, "embed", return_value=mock_response) as embed_patch:
+            embedder.run(text="The food was delicious")
+            second = embedder.run(text="The food was delicious")
+
+        assert embed_patch.call_count == 1
+        assert second["meta"]["total_tokens"] == 0
+        # int8 quantization is lossy by at most one scale step per component
+        scale = np.abs(np.asarray(_MOCK_EMBEDDING, dtype=np.float32)).max() / 127.0
+        assert np.allclose(second["embedding"], _MOCK_EMBEDDING, atol=scale)
+
+    @pytest.mark.unit
+    def test_run_semantic_cache_hit(self):
+        embedder = VoyageTextEmbedder(api_key=Secret.from_token("fake-api-key"), semantic_threshold=0.6)
+
+        mock_response = MagicMock()
+        mock_response.embeddings = [_MOCK_EMBEDDING]
+        mock_response.total_tokens = 2
+
+        with patch.object(embedder.client, "embed", return_value=mock_response) as embed_patch:
+            first = embedder.run(text="hello world")
+            # formatting variant of the seeded text: served by the semantic tier without an API call
+            second = embedder.run(text="Hello, world!")
+            embedder.run(text="a completely different sentence")
+
+        assert embed_patch.call_count == 2
+        assert second["embedding"] == first["embedding"]
+        assert second["meta"]["total_tokens"] == 0
+
+    @pytest.mark.unit
+    def test_run_return_numpy(self):
+        embedder = VoyageTextEmbedder(api_key=Secret.from_token("fake-api-key"), return_numpy=True)
+
+        mock_response = MagicMock()
+        mock_response.embeddings = [_MOCK_EMBEDDING]
+        mock_response.total_tokens = 6
+
+        with patch.object(embedder.client, "embed", return_value=mock_response):
+            single = embedder.run(text="The food was delicious")
+
+        assert isinstance(single["embedding"], np.ndarray)
+        assert single["embedding"].dtype == np.float32
+        assert single["embedding"].shape == (1024,)
+
+        mock_response.embeddings = [_MOCK_EMBEDDING] * 3
+        with patch.object(embedder.client, "embed", return_value=mock_response):
+            batch = embedder.run_batch(texts=["first", "second", "third"])
+
+        assert isinstance(batch["embeddings"], np.ndarray)
+        assert batch["embeddings"].dtype == np.float32
+        assert batch["embeddings"].shape == (3, 1024)
+
+    @pytest.mark.unit
+    def test_run_with_persistent_cache(self, tmp_path):
+        cache_path = tmp_path / "text_cache.db"
+
+        mock_response = MagicMock()
+        mock_response.embeddings = [_MOCK_EMBEDDING]
+        mock_response.total_tokens = 6
+
+        first_embedder = VoyageTextEmbedder(api_key=Secret.from_token("fake-api-key"), cache_path=cache_path)
+        # get_client shares one client across instances, so one patch covers both embedders
+        with patch.object(first_embedder.client, "embed", return_value=mock_response) as embed_patch:
+            first = first_embedder.run(text="The food was delicious")
+
+            second_embedder = VoyageTextEmbedder(api_key=Secret.from_token("fake-api-key"), cache_path=cache_path)
+            second = second_embedder.run(text="The food was delicious")
+
+        assert embed_patch.call_count == 1
+        assert second["meta"]["total_tokens"] == 0
+        assert np.allclose(second["embedding"], first["embedding"])
+
+    @pytest.mark.unit
+    def test_run_batch_wrong_input_format(self):
+        embedder = VoyageTextEmbedder(api_key=Secret.from_token("fake-api-key"))
+
+        with pytest.raises(TypeError, match="VoyageTextEmbedder.run_batch expects a list of strings"):
+            embedder.run_batch(texts=[1, 2, 3])
+
     @pytest.mark.unit
     def test_run_wrong_input_format(self):
         embedder = VoyageTextEmbedder(api_key=Secret.from_token("fake-api-key"))